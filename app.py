@@ -0,0 +1,18 @@
+"""Both teaching apps as one multipage Streamlit application
+
+``streamlit run app.py`` serves the basics and the data science pages from a
+single server process, so they share one execution backend, result cache and
+set of warm workers.
+"""
+import streamlit as st
+
+import shared
+
+shared.MULTIPAGE = True
+st.set_page_config(page_title="Python Basics & Data Science", layout="wide")
+
+page = st.navigation([
+    st.Page("basicc.py", title="Python Basics for Beginners", icon="🐍", default=True),
+    st.Page("libr.py", title="Python Data Science Basics", icon="📊"),
+])
+page.run()
@@ -0,0 +1 @@
+"""Measurement tools for the apps; run the modules with ``python -m bench.<name>``"""
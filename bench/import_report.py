@@ -0,0 +1,119 @@
+"""Before/after report of import time and first-paint latency for both apps
+
+    python -m bench.import_report [--ref REV] [--repeat N]
+
+Every measurement runs in a fresh interpreter so nothing is already imported:
+
+* ``imports`` - time to execute the app's top-level import statements, after
+  streamlit itself is imported (every app pays for that equally);
+* ``first paint`` - time for Streamlit's headless ``AppTest`` to run the script
+  once with default widget values, i.e. what the first visitor waits for.
+
+With ``--ref`` the same measurements are taken on the tree as it was at that git
+revision (extracted with ``git archive``) and reported side by side.
+"""
+import argparse
+import io
+import json
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APPS = ["basicc.py", "libr.py"]
+
+IMPORTS_SCRIPT = """
+import ast, json, sys, time
+import streamlit
+app = sys.argv[1]
+tree = ast.parse(open(app, encoding="utf-8").read())
+imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+code = compile(ast.Module(body=imports, type_ignores=[]), app, "exec")
+start = time.perf_counter()
+exec(code, {})
+print(json.dumps(time.perf_counter() - start))
+"""
+
+FIRST_PAINT_SCRIPT = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+AppTest.from_file(sys.argv[1], default_timeout=300).run()
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def _measure(script, tree, app, repeat):
+    samples = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", script, str(tree / app)],
+            cwd=tree, capture_output=True, text=True, check=True,
+        )
+        samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def measure_tree(tree, repeat):
+    """Median import and first-paint seconds for each app in ``tree``"""
+    return {
+        app: {
+            "imports": _measure(IMPORTS_SCRIPT, tree, app, repeat),
+            "first paint": _measure(FIRST_PAINT_SCRIPT, tree, app, repeat),
+        }
+        for app in APPS
+        if (tree / app).exists()
+    }
+
+
+def extract_revision(ref, destination):
+    archive = subprocess.run(["git", "archive", ref], cwd=ROOT, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(destination)
+
+
+def format_report(after, before=None):
+    lines = []
+    if before is None:
+        lines.append(f"{'app':<12}{'metric':<14}{'seconds':>10}")
+        for app, metrics in after.items():
+            for metric, seconds in metrics.items():
+                lines.append(f"{app:<12}{metric:<14}{seconds:>10.3f}")
+        return "\n".join(lines)
+    lines.append(f"{'app':<12}{'metric':<14}{'before':>10}{'after':>10}{'change':>10}")
+    for app, metrics in after.items():
+        for metric, seconds in metrics.items():
+            old = before.get(app, {}).get(metric)
+            if old is None:
+                lines.append(f"{app:<12}{metric:<14}{'-':>10}{seconds:>10.3f}{'-':>10}")
+            else:
+                change = (seconds - old) / old * 100 if old else 0.0
+                lines.append(f"{app:<12}{metric:<14}{old:>10.3f}{seconds:>10.3f}{change:>+9.1f}%")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure app import time and first-paint latency")
+    parser.add_argument("--ref", help="git revision to compare against (e.g. HEAD~1)")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    after = measure_tree(ROOT, args.repeat)
+    before = None
+    if args.ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            extract_revision(args.ref, tmp)
+            before = measure_tree(Path(tmp), args.repeat)
+
+    if args.json:
+        print(json.dumps({"before": before, "after": after}, indent=2))
+    else:
+        print(format_report(after, before))
+
+
+if __name__ == "__main__":
+    main()
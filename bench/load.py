@@ -0,0 +1,180 @@
+"""Concurrent-session load generator for capacity planning
+
+    python -m bench.load --app data_science --sessions 50 --duration 60 --mix section=1,run=3
+
+Simulates N students, each a headless ``AppTest`` session in a process of its
+own: ``AppTest`` installs process-wide Streamlit state (the runtime, config) for
+every run, so sessions sharing an interpreter would tear down each other's
+state. Each process therefore has its own runner too, with its own result cache
+and pool; the ``--workers`` pool workers (default: one per CPU) are divided
+between them so the machine runs about as many workers as one server would.
+Results cached by one session are not seen by the others, so the report is a
+pessimistic estimate for many students clicking the same examples.
+Each session repeatedly picks an action by weight from ``--mix``:
+
+* ``section`` - switch the sidebar to a random section and rerun;
+* ``run`` - click a random Run button of the current section and rerun.
+
+The report gives throughput and p50/p95/p99 latency of every action type and
+of the snippet executions (``run_code``/``execute_code``) behind the clicks.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import examples
+import runner
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_FILES = {"basics": "basicc.py", "data_science": "libr.py"}
+
+
+class Recorder:
+    """Thread-safe collection of latency samples by label"""
+
+    def __init__(self):
+        self.samples = {}
+        self._lock = threading.Lock()
+
+    def add(self, label, seconds):
+        with self._lock:
+            self.samples.setdefault(label, []).append(seconds)
+
+
+def percentiles(values):
+    if len(values) < 2:
+        return {"p50": values[0], "p95": values[0], "p99": values[0]}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        action, _, weight = part.partition("=")
+        if action not in ("section", "run"):
+            raise argparse.ArgumentTypeError(f"unknown action {action!r}")
+        mix[action] = float(weight or 1)
+    return mix
+
+
+def instrument_execute(recorder):
+    """Record the latency of every snippet execution the apps make"""
+    execute = runner.execute
+
+    def timed_execute(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return execute(*args, **kwargs)
+        finally:
+            recorder.add("execute", time.perf_counter() - start)
+
+    # The pages look up runner.execute on every call (shared.run)
+    runner.execute = timed_execute
+
+
+def session(app, mix, deadline, max_actions, seed):
+    """Drive one simulated student until ``deadline`` (epoch seconds); returns the latency samples"""
+    from streamlit.testing.v1 import AppTest
+
+    recorder = Recorder()
+    instrument_execute(recorder)
+    rng = random.Random(seed)
+    actions, weights = zip(*mix.items())
+    section_titles = examples.section_titles(app)
+    at = AppTest.from_file(str(ROOT / APP_FILES[app]), default_timeout=300)
+    start = time.perf_counter()
+    at.run()
+    recorder.add("boot", time.perf_counter() - start)
+    section = section_titles[0]
+    done = 0
+    while time.time() < deadline and (not max_actions or done < max_actions):
+        action = rng.choices(actions, weights)[0]
+        if action == "section":
+            section = rng.choice(section_titles)
+            step = at.sidebar.radio[0].set_value(section)
+        else:
+            example = rng.choice(examples.for_section(app, section))
+            step = at.button(key=example.id).click()
+        start = time.perf_counter()
+        at = step.run()
+        recorder.add(action, time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(f"{action} raised: {at.exception[0].value}")
+        done += 1
+    return recorder.samples
+
+
+def run_load(app, sessions, duration, max_actions, mix, seed=0, workers=None):
+    """Run ``sessions`` session processes side by side; returns merged samples, elapsed seconds and errors"""
+    workers = workers or os.cpu_count() or 1
+    env = dict(os.environ, RUNNER_WORKERS=str(max(workers // sessions, 1)))
+    started = time.perf_counter()
+    deadline = time.time() + duration
+    mix_text = ",".join(f"{action}={weight}" for action, weight in mix.items())
+    children = [
+        subprocess.Popen(
+            [sys.executable, "-m", "bench.load", "--child", "--app", app, "--deadline", str(deadline),
+             "--actions", str(max_actions), "--mix", mix_text, "--seed", str(seed + i)],
+            cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        for i in range(sessions)
+    ]
+    samples, errors = {}, []
+    for child in children:
+        stdout, stderr = child.communicate()
+        if child.returncode:
+            errors.append(stderr.strip().splitlines()[-1] if stderr.strip() else f"exit status {child.returncode}")
+            continue
+        for label, values in json.loads(stdout.strip().splitlines()[-1]).items():
+            samples.setdefault(label, []).extend(values)
+    return samples, time.perf_counter() - started, errors
+
+
+def format_report(samples, elapsed):
+    lines = [f"{'action':<10}{'count':>8}{'per s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+    for label, values in sorted(samples.items()):
+        stats = percentiles(values)
+        lines.append(
+            f"{label:<10}{len(values):>8}{len(values) / elapsed:>10.1f}"
+            f"{stats['p50'] * 1000:>10.1f}{stats['p95'] * 1000:>10.1f}{stats['p99'] * 1000:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent sessions against an app")
+    parser.add_argument("--app", choices=sorted(APP_FILES), default="data_science")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent simulated students")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to keep generating load")
+    parser.add_argument("--actions", type=int, default=0, help="stop each session after this many actions")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("section=1,run=3"),
+                        help="action weights, e.g. section=1,run=3")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="pool workers shared out between the sessions")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--deadline", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(session(args.app, args.mix, args.deadline, args.actions, args.seed)))
+        return 0
+
+    samples, elapsed, errors = run_load(
+        args.app, args.sessions, args.duration, args.actions, args.mix, args.seed, args.workers)
+    print(f"{args.sessions} sessions on {args.app} for {elapsed:.1f} s")
+    print(format_report(samples, elapsed))
+    for error in errors:
+        print(f"session failed: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Startup, section-render and Run-click benchmark for both apps
+
+    python -m bench.render [--repeat N] [--save | --check] [--threshold 0.2]
+
+Each app is loaded in a fresh interpreter with Streamlit's headless ``AppTest``.
+The harness times the first script run (cold boot) and a rerun (warm), switches
+the sidebar to every section of the example registry, and clicks every Run
+button twice: the first click executes the snippet, the second is served from
+the result cache. The warm-up snapshot is disabled so cold clicks really run.
+
+``--save`` writes the medians to the baseline file; ``--check`` compares against
+it and exits with status 1 when any timing is slower than the baseline by more
+than ``--threshold`` (a fraction) and by more than ``--min-delta`` seconds.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import examples
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+APP_FILES = {"basics": "basicc.py", "data_science": "libr.py"}
+
+
+def _timed(action):
+    start = time.perf_counter()
+    at = action()
+    return at, time.perf_counter() - start
+
+
+def measure_app(app):
+    """Time one pass over ``app``; must run in a fresh interpreter for cold numbers"""
+    from streamlit.testing.v1 import AppTest
+
+    timings = {}
+    at = AppTest.from_file(str(ROOT / APP_FILES[app]), default_timeout=300)
+    at, timings[f"{app}/boot"] = _timed(at.run)
+    at, timings[f"{app}/rerun"] = _timed(at.run)
+    for section in examples.section_titles(app):
+        at, timings[f"{app}/section/{section}"] = _timed(at.sidebar.radio[0].set_value(section).run)
+        for example in examples.for_section(app, section):
+            for phase in ("cold", "warm"):
+                at, timings[f"{app}/run/{example.id}/{phase}"] = _timed(at.button(key=example.id).click().run)
+    if at.exception:
+        raise RuntimeError(f"{app} raised while benchmarking: {at.exception[0].value}")
+    return timings
+
+
+def run_isolated(app):
+    env = dict(os.environ, RUNNER_SNAPSHOT=os.devnull)
+    completed = subprocess.run(
+        [sys.executable, "-m", "bench.render", "--child", app],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def collect(apps, repeat):
+    """Median of ``repeat`` isolated passes for every timing"""
+    samples = {}
+    for _ in range(repeat):
+        for app in apps:
+            for name, seconds in run_isolated(app).items():
+                samples.setdefault(name, []).append(seconds)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def regressions(current, baseline, threshold, min_delta):
+    """(name, baseline, current) for every timing that regressed past the limits"""
+    slower = []
+    for name, seconds in current.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if seconds > reference * (1 + threshold) and seconds - reference > min_delta:
+            slower.append((name, reference, seconds))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark app boot, section render and Run clicks")
+    parser.add_argument("--app", choices=sorted(APP_FILES), action="append", help="only benchmark this app")
+    parser.add_argument("--repeat", type=int, default=3, help="isolated passes per app")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline JSON file")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    mode.add_argument("--check", action="store_true", help="fail on regressions against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="ignore slowdowns below this many seconds")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_app(args.child)))
+        return 0
+
+    current = collect(args.app or list(APP_FILES), args.repeat)
+    for name, seconds in current.items():
+        print(f"{seconds * 1000:10.1f} ms  {name}")
+
+    if args.save:
+        Path(args.baseline).write_text(json.dumps(current, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+    elif args.check:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        slower = regressions(current, baseline, args.threshold, args.min_delta)
+        for name, reference, seconds in slower:
+            print(f"REGRESSION {name}: {reference * 1000:.1f} ms -> {seconds * 1000:.1f} ms")
+        if slower:
+            return 1
+        print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
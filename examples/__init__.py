@@ -0,0 +1,29 @@
+"""Registry of every runnable example shown by the apps
+
+Apps render their sections from here, and the caches, warm-up snapshot and
+benchmarks iterate over the same entries, so adding an example in one place
+makes it available to all of them.
+"""
+from examples import basics, data_science
+from examples.model import Example, Section
+
+APPS = {
+    "basics": basics,
+    "data_science": data_science,
+}
+
+EXAMPLES = {example.id: example for app in APPS.values() for example in app.EXAMPLES}
+
+
+def sections(app):
+    return APPS[app].SECTIONS
+
+
+def section_titles(app):
+    return [section.title for section in APPS[app].SECTIONS]
+
+
+def for_section(app, section):
+    """Examples of ``app`` in the order they appear under ``section``"""
+    return [example for example in APPS[app].EXAMPLES if example.section == section]
+
@@ -0,0 +1,356 @@
+"""Row-wise pandas anti-patterns in a snippet, with vectorized rewrites
+
+``detect`` walks a snippet's AST and reports the patterns that call Python once
+per row or per group, or that silently modify nothing:
+
+* ``df['col'].apply(f)``/``.map(f)`` and ``df.apply(f, axis=1)``, where ``f`` is a
+  lambda or a function of the snippet made of ``if``/``return`` branches, are
+  rewritten with ``np.select``
+* ``df.groupby(key).apply(f)`` and ``df.groupby(key)[columns].apply(f)``, where
+  ``f`` picks a row with ``idxmax``/``idxmin`` or aggregates one column, are
+  rewritten with ``idxmax`` + ``loc`` or the aggregation itself
+* chained assignment (``df[mask]['col'] = v``) is rewritten with ``loc``
+* ``iterrows`` and Python loops over a DataFrame's columns are only reported
+
+``harness_source`` builds a snippet that runs the statements before a finding
+and then times the original expression against its rewrite, checking that both
+give the same values. The apps run it on a scaled dataset through the normal
+execution pipeline, like the vectorization lab.
+"""
+import ast
+import copy
+import json
+from dataclasses import dataclass
+
+from examples.vectorization import MEASURE
+
+# Calls whose result is treated as a DataFrame, so that names bound to it are tracked
+FRAME_FACTORIES = frozenset({
+    "DataFrame", "read_csv", "read_excel", "read_json", "read_parquet", "read_feather",
+    "concat", "merge", "pivot_table", "employees",
+})
+AGGREGATIONS = frozenset({"sum", "mean", "median", "min", "max", "count", "std", "var", "nunique"})
+# Kinds whose rewrite computes the same value faster, and is worth timing
+TIMED = frozenset({"row-wise apply", "groupby apply"})
+
+HARNESS = """\
+import contextlib, io, json, timeit
+import numpy as np
+import pandas as pd
+
+# The snippet up to the finding, with its printing silenced
+with contextlib.redirect_stdout(io.StringIO()):
+    exec({setup!r}, globals())
+
+{measure}
+def same(a, b):
+    a, b = (pd.DataFrame(x).reset_index(drop=True) for x in (a, b))
+    if a.shape != b.shape:
+        return False
+    a.columns = b.columns = range(a.shape[1])
+    try:
+        pd.testing.assert_frame_equal(a, b, check_dtype=False)
+    except AssertionError:
+        return False
+    return True
+
+original, rewrite = {original!r}, {rewrite!r}
+print(json.dumps({{
+    "original": measure(original),
+    "rewrite": measure(rewrite),
+    "same": same(eval(original), eval(rewrite)),
+}}))
+"""
+
+
+@dataclass
+class Finding:
+    """An anti-pattern at ``line`` of a snippet, with a vectorized ``rewrite`` when one is known
+
+    ``statement`` is the index of the top-level statement containing it and
+    ``code`` the offending expression or statement. ``timed`` findings have an
+    expression rewrite that ``harness_source`` can measure against ``code``.
+    """
+    kind: str
+    line: int
+    statement: int
+    code: str
+    message: str
+    rewrite: str = ""
+    timed: bool = False
+
+
+class _NotVectorizable(Exception):
+    pass
+
+
+def _root(node):
+    while isinstance(node, (ast.Attribute, ast.Subscript, ast.Call)):
+        node = node.func if isinstance(node, ast.Call) else node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def _makes_frame(node, frames):
+    if isinstance(node, ast.Call):
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if name in FRAME_FACTORIES:
+            return True
+    return _root(node) in frames
+
+
+def _is_column(node, frames):
+    """Whether ``node`` is ``frame['name']``"""
+    return (
+        isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id in frames
+        and isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, str)
+    )
+
+
+class _Vectorize(ast.NodeTransformer):
+    """Turns an expression over one element (or row) ``param`` into one over ``target``"""
+
+    def __init__(self, param, target, rowwise):
+        self.param = param
+        self.target = target
+        self.rowwise = rowwise
+
+    def visit_Name(self, node):
+        if node.id != self.param:
+            return node
+        if self.rowwise:
+            raise _NotVectorizable  # the row used as a whole
+        return copy.deepcopy(self.target)
+
+    def visit_Subscript(self, node):
+        if isinstance(node.value, ast.Name) and node.value.id == self.param:
+            if not self.rowwise:
+                raise _NotVectorizable  # indexing into a single value
+            return ast.Subscript(copy.deepcopy(self.target), self.visit(node.slice), ast.Load())
+        return self.generic_visit(node)
+
+    def visit_Attribute(self, node):
+        if isinstance(node.value, ast.Name) and node.value.id == self.param:
+            raise _NotVectorizable  # e.g. a str method
+        return self.generic_visit(node)
+
+    def visit_Call(self, node):
+        # Only NumPy and pandas functions accept whole columns
+        if not (isinstance(node.func, ast.Attribute) and _root(node.func) in ("np", "pd")):
+            raise _NotVectorizable
+        return self.generic_visit(node)
+
+    def visit_BoolOp(self, node):
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        values = [self.visit(value) for value in node.values]
+        result = values[0]
+        for value in values[1:]:
+            result = ast.BinOp(result, op, value)
+        return result
+
+    def visit_UnaryOp(self, node):
+        node = self.generic_visit(node)
+        return ast.UnaryOp(ast.Invert(), node.operand) if isinstance(node.op, ast.Not) else node
+
+    def visit_Compare(self, node):
+        node = self.generic_visit(node)
+        if any(isinstance(op, (ast.Is, ast.IsNot, ast.In, ast.NotIn)) for op in node.ops):
+            raise _NotVectorizable
+        # a < x < b is (a < x) & (x < b)
+        operands = [node.left, *node.comparators]
+        result = None
+        for left, op, right in zip(operands, node.ops, operands[1:]):
+            part = ast.Compare(left, [op], [right])
+            result = part if result is None else ast.BinOp(result, ast.BitAnd(), part)
+        return result
+
+    def visit_IfExp(self, node):
+        raise _NotVectorizable
+
+    def visit_Lambda(self, node):
+        raise _NotVectorizable
+
+
+def _callback(node, functions):
+    """(parameter, body) of a one-argument lambda or function of the snippet, or None"""
+    if isinstance(node, ast.Lambda):
+        definition, body = node, node.body
+    elif isinstance(node, ast.Name) and node.id in functions:
+        definition = functions[node.id]
+        body = definition.body
+    else:
+        return None
+    args = definition.args
+    if args.posonlyargs or args.vararg or args.kwonlyargs or args.kwarg or len(args.args) != 1:
+        return None
+    return args.args[0].arg, body
+
+
+def _branches(body):
+    """(conditions, values, default) of a lambda's conditional expression or a chain of ``if ...: return ...``"""
+    conditions, values = [], []
+    if isinstance(body, ast.expr):
+        while isinstance(body, ast.IfExp):
+            conditions.append(body.test)
+            values.append(body.body)
+            body = body.orelse
+        return conditions, values, body
+    statements = list(body)
+    if statements and isinstance(statements[0], ast.Expr) and isinstance(statements[0].value, ast.Constant):
+        statements.pop(0)  # docstring
+    while statements:
+        stmt = statements.pop(0)
+        if isinstance(stmt, ast.Return) and stmt.value is not None:
+            return conditions, values, stmt.value
+        if not (isinstance(stmt, ast.If) and len(stmt.body) == 1 and isinstance(stmt.body[0], ast.Return)
+                and stmt.body[0].value is not None):
+            raise _NotVectorizable
+        conditions.append(stmt.test)
+        values.append(stmt.body[0].value)
+        statements[:0] = stmt.orelse
+    raise _NotVectorizable  # falls off the end and returns None
+
+
+def _select(callback, target, rowwise):
+    """``np.select`` rewrite of applying ``callback`` to ``target``"""
+    param, body = callback
+    conditions, values, default = _branches(body)
+
+    def vectorize(node):
+        return ast.unparse(_Vectorize(param, target, rowwise).visit(copy.deepcopy(node)))
+
+    if not conditions:
+        return vectorize(default)
+    return (
+        f"pd.Series(np.select([{', '.join(map(vectorize, conditions))}], "
+        f"[{', '.join(map(vectorize, values))}], default={vectorize(default)}), "
+        f"index={ast.unparse(target)}.index)"
+    )
+
+
+def _group_rewrite(groupby, callback):
+    """Rewrite of ``groupby.apply(callback)`` for row picks and single-column aggregations"""
+    param, body = callback
+    conditions, _, expr = _branches(body)
+    if conditions:
+        raise _NotVectorizable
+
+    def column(node):
+        # group['col'] -> 'col'
+        if (isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == param
+                and isinstance(node.slice, ast.Constant)):
+            return ast.unparse(node.slice)
+        raise _NotVectorizable
+
+    frame = ast.unparse(groupby.func.value)
+    grouped = ast.unparse(groupby)
+    if (isinstance(expr, ast.Subscript) and isinstance(expr.value, ast.Attribute) and expr.value.attr == "loc"
+            and isinstance(expr.value.value, ast.Name) and expr.value.value.id == param
+            and isinstance(expr.slice, ast.Call) and isinstance(expr.slice.func, ast.Attribute)
+            and expr.slice.func.attr in ("idxmax", "idxmin") and not expr.slice.args):
+        # group.loc[group['col'].idxmax()]: one row label per group, picked without calling Python
+        rewrite = f"{frame}.loc[{grouped}[{column(expr.slice.func.value)}].{expr.slice.func.attr}()]"
+        key = groupby.args[0] if len(groupby.args) == 1 else None
+        if isinstance(key, ast.Constant) and isinstance(key.value, str):
+            rewrite += f".set_index({key.value!r}, drop=False)"  # indexed by group, as apply returns it
+        return rewrite
+    if (isinstance(expr, ast.Call) and isinstance(expr.func, ast.Attribute) and expr.func.attr in AGGREGATIONS
+            and not expr.args and not expr.keywords):
+        return f"{grouped}[{column(expr.func.value)}].{expr.func.attr}()"
+    raise _NotVectorizable
+
+
+def _inspect(node, frames, functions):
+    """(kind, message, rewrite) if ``node`` is an anti-pattern, else None"""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        attr, owner = node.func.attr, node.func.value
+        if attr == "iterrows" and _root(owner) in frames:
+            return ("iterrows", "Builds a Series for every row and runs the loop body in Python. "
+                    "Express the body as column operations, or use itertuples() if a loop is unavoidable.", "")
+        if attr not in ("apply", "map") or len(node.args) != 1:
+            return None
+        callback = _callback(node.args[0], functions)
+        if callback is None:
+            return None
+        # df.groupby(key) or df.groupby(key)[columns]
+        groupby = owner.value if isinstance(owner, ast.Subscript) else owner
+        if (attr == "apply" and isinstance(groupby, ast.Call) and isinstance(groupby.func, ast.Attribute)
+                and groupby.func.attr == "groupby" and _root(groupby) in frames):
+            kind, message = "groupby apply", "Calls a Python function once per group and concatenates the results."
+            hint = " Use agg, transform or idxmax on the grouped columns instead."
+            build, args = _group_rewrite, (groupby, callback)
+        elif _is_column(owner, frames):
+            kind, message = "row-wise apply", "Calls a Python function once per value of the column."
+            hint = " Express it with column operations, np.select or pd.cut."
+            build, args = _select, (callback, owner, False)
+        elif (attr == "apply" and isinstance(owner, ast.Name) and owner.id in frames and any(
+                k.arg == "axis" and isinstance(k.value, ast.Constant) and k.value.value in (1, "columns")
+                for k in node.keywords)):
+            kind, message = "row-wise apply", "Calls a Python function once per row, building a Series for each."
+            hint = " Express it with column operations, np.select or pd.cut."
+            build, args = _select, (callback, owner, True)
+        else:
+            return None
+        try:
+            return kind, message, build(*args)
+        except _NotVectorizable:
+            return kind, message + hint, ""
+    if isinstance(node, ast.For) and (
+            isinstance(node.iter, ast.Name) and node.iter.id in frames
+            or isinstance(node.iter, ast.Attribute) and node.iter.attr == "columns" and _root(node.iter) in frames):
+        return ("column loop", "Loops over the columns in Python. Most DataFrame methods (fillna, astype, "
+                "select_dtypes(...).mean(), ...) work on all columns at once.", "")
+    if isinstance(node, ast.Assign) and len(node.targets) == 1:
+        target = node.targets[0]
+        if not (isinstance(target, ast.Subscript) and isinstance(target.value, ast.Subscript)
+                and isinstance(target.value.value, ast.Name) and target.value.value.id in frames):
+            return None
+        message = ("Assigns to a temporary copy, so the DataFrame is left unchanged "
+                   "(SettingWithCopyWarning). Select rows and column in one .loc[].")
+        outer, inner = target.slice, target.value.slice
+        if isinstance(outer, ast.Tuple) or isinstance(inner, ast.Tuple):
+            return "chained assignment", message, ""
+        # df['col'][rows] or df[rows]['col']
+        rows, col = (outer, inner) if isinstance(inner, ast.Constant) and isinstance(inner.value, str) else (inner, outer)
+        rewrite = f"{target.value.value.id}.loc[{ast.unparse(rows)}, {ast.unparse(col)}] = {ast.unparse(node.value)}"
+        return "chained assignment", message, rewrite
+    return None
+
+
+def detect(source):
+    """Findings in ``source``, in line order; none if it does not parse"""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+    functions = {stmt.name: stmt for stmt in tree.body if isinstance(stmt, ast.FunctionDef)}
+    frames = set()
+    findings = []
+    for index, stmt in enumerate(tree.body):
+        # Only expressions of plain top-level statements can be timed after the statements before them
+        simple = isinstance(stmt, (ast.Expr, ast.Assign, ast.AugAssign, ast.AnnAssign))
+        for node in ast.walk(stmt):
+            found = _inspect(node, frames, functions)
+            if found is None:
+                continue
+            kind, message, rewrite = found
+            findings.append(Finding(
+                kind, node.lineno, index, ast.get_source_segment(source, node), message, rewrite,
+                timed=bool(rewrite) and simple and kind in TIMED,
+            ))
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Assign) and _makes_frame(node.value, frames):
+                frames.update(target.id for target in node.targets if isinstance(target, ast.Name))
+    return sorted(findings, key=lambda finding: finding.line)
+
+
+def harness_source(source, finding):
+    """Snippet timing ``finding``'s code against its rewrite after the statements before it"""
+    tree = ast.parse(source)
+    setup = "\n".join(ast.get_source_segment(source, stmt) for stmt in tree.body[:finding.statement])
+    return HARNESS.format(setup=setup, measure=MEASURE, original=finding.code, rewrite=finding.rewrite)
+
+
+def parse(result):
+    """Seconds per call of the ``original`` and ``rewrite`` and whether they agree (``same``)"""
+    return json.loads(result.output.strip().splitlines()[-1])
@@ -0,0 +1,764 @@
+"""Examples shown by libr.py, the NumPy and pandas app"""
+from examples.model import Example, Section
+
+SECTIONS = [
+    Section(title="NumPy Basics"),
+    Section(title="NumPy Operations"),
+    Section(title="Pandas Basics"),
+    Section(title="Pandas Operations"),
+    Section(title="Common Errors & Solutions"),
+]
+
+EXAMPLES = [
+    # NumPy Basics
+    Example(
+        id="example1",
+        section="NumPy Basics",
+        title="Creating NumPy Arrays",
+        button="Run NumPy Array Creation Examples",
+        source="""
+import numpy as np
+
+# Creating a simple array
+simple_array = np.array([1, 2, 3, 4, 5])
+print("Simple array:")
+print(simple_array)
+print("Type:", type(simple_array))
+print("Shape:", simple_array.shape)
+
+# Creating a 2D array
+matrix = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+print("\\n2D array (matrix):")
+print(matrix)
+print("Shape:", matrix.shape)
+
+# Array of zeros
+zeros = np.zeros((3, 4))
+print("\\nArray of zeros:")
+print(zeros)
+
+# Array of ones
+ones = np.ones((2, 3))
+print("\\nArray of ones:")
+print(ones)
+
+# Array with a range of values
+range_array = np.arange(0, 10, 2)  # start, stop, step
+print("\\nRange array:")
+print(range_array)
+
+# Linspace - evenly spaced values within a specified interval
+linspace = np.linspace(0, 1, 5)  # start, stop, num
+print("\\nLinspace array:")
+print(linspace)
+
+# Random numbers
+random_array = np.random.rand(3, 3)  # 3x3 array of random numbers between 0 and 1
+print("\\nRandom array:")
+print(random_array)
+""",
+        explanation="""
+    **Key NumPy Array Creation Functions:**
+
+    * `np.array()`: Creates an array from a list or tuple
+    * `np.zeros()`: Creates an array filled with zeros
+    * `np.ones()`: Creates an array filled with ones
+    * `np.arange()`: Creates an array with a range of values
+    * `np.linspace()`: Creates an array with evenly spaced values
+    * `np.random.rand()`: Creates an array with random values
+    """,
+        determinism="seeded",  # draws random numbers
+    ),
+    Example(
+        id="example2",
+        section="NumPy Basics",
+        title="Array Attributes and Methods",
+        button="Run NumPy Array Methods Examples",
+        source="""
+import numpy as np
+
+# Create a sample array
+arr = np.array([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])
+print("Original array:")
+print(arr)
+
+# Array attributes
+print("\\nArray attributes:")
+print("Shape:", arr.shape)
+print("Dimensions:", arr.ndim)
+print("Size:", arr.size)
+print("Data type:", arr.dtype)
+
+# Array methods
+print("\\nArray methods:")
+print("Sum of all elements:", arr.sum())
+print("Sum along rows (axis=1):", arr.sum(axis=1))
+print("Sum along columns (axis=0):", arr.sum(axis=0))
+print("Minimum value:", arr.min())
+print("Maximum value:", arr.max())
+print("Mean value:", arr.mean())
+print("Standard deviation:", arr.std())
+
+# Reshape the array
+reshaped = arr.reshape(4, 3)
+print("\\nReshaped array (4x3):")
+print(reshaped)
+
+# Flatten the array
+flattened = arr.flatten()
+print("\\nFlattened array:")
+print(flattened)
+
+# Transpose the array
+transposed = arr.T
+print("\\nTransposed array:")
+print(transposed)
+""",
+    ),
+    # NumPy Operations
+    Example(
+        id="example3",
+        section="NumPy Operations",
+        title="Array Indexing and Slicing",
+        button="Run NumPy Indexing Examples",
+        source="""
+import numpy as np
+
+# Create a sample array
+arr = np.array([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])
+print("Original array:")
+print(arr)
+
+# Indexing
+print("\\nIndexing:")
+print("Element at position [1, 2]:", arr[1, 2])  # row 1, column 2
+print("First row:", arr[0])
+print("Last row:", arr[-1])
+
+# Slicing
+print("\\nSlicing:")
+print("First two rows:")
+print(arr[0:2])
+print("\\nLast two columns:")
+print(arr[:, 2:4])
+print("\\nSubmatrix (top-left 2x2):")
+print(arr[0:2, 0:2])
+
+# Boolean indexing
+print("\\nBoolean indexing:")
+bool_mask = arr > 6
+print("Boolean mask (arr > 6):")
+print(bool_mask)
+print("\\nElements greater than 6:")
+print(arr[bool_mask])
+
+# Fancy indexing
+print("\\nFancy indexing:")
+row_indices = np.array([0, 2])
+col_indices = np.array([1, 3])
+print("Selected rows:", arr[row_indices])
+print("Selected elements:", arr[row_indices[:, np.newaxis], col_indices])
+""",
+    ),
+    Example(
+        id="example4",
+        section="NumPy Operations",
+        title="Array Operations",
+        button="Run NumPy Operations Examples",
+        source="""
+import numpy as np
+
+# Create sample arrays
+a = np.array([1, 2, 3, 4])
+b = np.array([5, 6, 7, 8])
+print("Array a:", a)
+print("Array b:", b)
+
+# Element-wise operations
+print("\\nElement-wise operations:")
+print("a + b =", a + b)
+print("a - b =", a - b)
+print("a * b =", a * b)
+print("a / b =", a / b)
+print("a ** 2 =", a ** 2)  # Square each element
+
+# Matrix operations
+A = np.array([[1, 2], [3, 4]])
+B = np.array([[5, 6], [7, 8]])
+print("\\nMatrix A:")
+print(A)
+print("Matrix B:")
+print(B)
+
+print("\\nMatrix operations:")
+print("A + B:")
+print(A + B)
+print("\\nMatrix multiplication (A @ B):")
+print(A @ B)  # Matrix multiplication
+print("\\nElement-wise multiplication (A * B):")
+print(A * B)
+
+# Dot product
+print("\\nDot product of vectors a and b:", np.dot(a, b))
+
+# Matrix-vector multiplication
+v = np.array([1, 2])
+print("\\nMatrix A:")
+print(A)
+print("Vector v:", v)
+print("Matrix-vector multiplication (A @ v):")
+print(A @ v)
+
+# Universal functions (ufuncs)
+print("\\nUniversal functions:")
+print("sin(a):", np.sin(a))
+print("exp(a):", np.exp(a))
+print("sqrt(a):", np.sqrt(a))
+print("log(a):", np.log(a))
+""",
+        explanation="""
+    **Key NumPy Operations:**
+
+    * **Element-wise operations**: `+`, `-`, `*`, `/`, `**`
+    * **Matrix multiplication**: `@` operator or `np.matmul()`
+    * **Dot product**: `np.dot()`
+    * **Universal functions (ufuncs)**: `np.sin()`, `np.exp()`, `np.sqrt()`, etc.
+
+    NumPy operations are significantly faster than equivalent operations using Python lists, especially for large arrays.
+    """,
+        lab="vectorization",
+    ),
+    # Pandas Basics
+    Example(
+        id="example5",
+        section="Pandas Basics",
+        title="Creating DataFrames and Series",
+        button="Run Pandas Creation Examples",
+        source="""
+import pandas as pd
+import numpy as np
+
+# Creating a Series
+print("Creating a Series:")
+s = pd.Series([1, 3, 5, np.nan, 6, 8])
+print(s)
+
+# Creating a DataFrame from a dictionary
+print("\\nCreating a DataFrame from a dictionary:")
+data = {
+    'Name': ['John', 'Anna', 'Peter', 'Linda'],
+    'Age': [28, 24, 35, 32],
+    'City': ['New York', 'Paris', 'Berlin', 'London'],
+    'Salary': [65000, 70000, 80000, 75000]
+}
+df = pd.DataFrame(data)
+print(df)
+
+# Creating a DataFrame from a NumPy array
+print("\\nCreating a DataFrame from a NumPy array:")
+array_data = np.random.randn(5, 4)  # 5 rows, 4 columns
+df_array = pd.DataFrame(
+    array_data,
+    index=pd.date_range('20230101', periods=5),
+    columns=list('ABCD')
+)
+print(df_array)
+
+# Creating a DataFrame from a CSV file (using a simple string as an example)
+print("\\nCreating a DataFrame from CSV data:")
+csv_data = '''
+Name,Age,Gender,Occupation
+Alice,24,F,Data Scientist
+Bob,27,M,Engineer
+Charlie,31,M,Designer
+Diana,29,F,Doctor
+'''
+import io
+df_csv = pd.read_csv(io.StringIO(csv_data))
+print(df_csv)
+
+# Series and DataFrame attributes
+print("\\nSeries attributes:")
+print("Shape:", s.shape)
+print("Size:", s.size)
+print("Data type:", s.dtype)
+
+print("\\nDataFrame attributes:")
+print("Shape:", df.shape)
+print("Columns:", df.columns)
+print("Index:", df.index)
+print("Data types:")
+print(df.dtypes)
+""",
+        explanation="""
+    **Key Pandas Data Structures:**
+
+    * **Series**: 1D labeled array capable of holding any data type
+    * **DataFrame**: 2D labeled data structure with columns of potentially different types
+
+    **Common Ways to Create DataFrames:**
+
+    * From dictionaries with `pd.DataFrame(dict)`
+    * From NumPy arrays with `pd.DataFrame(array)`
+    * From CSV files with `pd.read_csv()`
+    * From Excel files with `pd.read_excel()`
+    * From SQL queries with `pd.read_sql()`
+    """,
+        determinism="seeded",  # draws random numbers
+    ),
+    Example(
+        id="example6",
+        section="Pandas Basics",
+        title="Viewing and Selecting Data",
+        button="Run Pandas Viewing and Selection Examples",
+        source="""
+import io
+import pandas as pd
+import numpy as np
+
+# Create a sample DataFrame
+data = {
+    'Name': ['John', 'Anna', 'Peter', 'Linda', 'Max', 'Sofia'],
+    'Age': [28, 24, 35, 32, 45, 37],
+    'City': ['New York', 'Paris', 'Berlin', 'London', 'Tokyo', 'Madrid'],
+    'Department': ['Sales', 'Engineering', 'Marketing', 'HR', 'Sales', 'Engineering'],
+    'Salary': [65000, 70000, 80000, 75000, 90000, 85000],
+    'Experience': [3, 2, 7, 5, 10, 8]
+}
+df = pd.DataFrame(data)
+print("Original DataFrame:")
+print(df)
+
+# Basic viewing methods
+print("\\nFirst 3 rows (head):")
+print(df.head(3))
+
+print("\\nLast 2 rows (tail):")
+print(df.tail(2))
+
+print("\\nSummary statistics:")
+print(df.describe())
+
+print("\\nInformation about DataFrame:")
+df_info_buffer = io.StringIO()
+df.info(buf=df_info_buffer)
+print(df_info_buffer.getvalue())
+
+# Basic selection
+print("\\nSelecting a single column (returns a Series):")
+print(df['Name'])
+
+print("\\nSelecting multiple columns:")
+print(df[['Name', 'Salary']])
+
+# Selection by label
+print("\\nSelection by label (loc):")
+print("Row at index 2:")
+print(df.loc[2])
+
+print("\\nRows 1-3, columns 'Name' and 'Salary':")
+print(df.loc[1:3, ['Name', 'Salary']])
+
+# Selection by position
+print("\\nSelection by position (iloc):")
+print("Row at position 0:")
+print(df.iloc[0])
+
+print("\\nRows 1-3, columns 0 and 4:")
+print(df.iloc[1:4, [0, 4]])
+
+# Boolean indexing
+print("\\nBoolean indexing:")
+print("People older than 30:")
+print(df[df['Age'] > 30])
+
+print("\\nEngineers with salary > 75000:")
+print(df[(df['Department'] == 'Engineering') & (df['Salary'] > 75000)])
+
+# Sorting
+print("\\nSorting by Age (ascending):")
+print(df.sort_values('Age'))
+
+print("\\nSorting by Salary (descending) and Age (ascending):")
+print(df.sort_values(['Salary', 'Age'], ascending=[False, True]))
+""",
+        dataset="employees({rows})",
+    ),
+    # Pandas Operations
+    Example(
+        id="example7",
+        section="Pandas Operations",
+        title="Data Cleaning and Preparation",
+        button="Run Data Cleaning Examples",
+        source="""
+import pandas as pd
+import numpy as np
+
+# Create a DataFrame with some missing values
+data = {
+    'Name': ['John', 'Anna', 'Peter', None, 'Max', 'Sofia'],
+    'Age': [28, None, 35, 32, 45, None],
+    'City': ['New York', 'Paris', None, 'London', 'Tokyo', 'Madrid'],
+    'Salary': [65000, 70000, np.nan, 75000, 90000, 85000]
+}
+df = pd.DataFrame(data)
+print("Original DataFrame with missing values:")
+print(df)
+
+# Check for missing values
+print("\\nMissing values in each column:")
+print(df.isnull().sum())
+
+# Drop rows with missing values
+print("\\nDropping rows with any missing values:")
+print(df.dropna())
+
+# Drop columns with missing values
+print("\\nDropping columns with any missing values:")
+print(df.dropna(axis=1))
+
+# Fill missing values
+print("\\nFilling missing values with a specific value:")
+print(df.fillna({'Name': 'Unknown', 'Age': df['Age'].mean(), 'City': 'Unknown', 'Salary': df['Salary'].median()}))
+
+# Replace values
+print("\\nReplacing 'New York' with 'NYC':")
+print(df.replace('New York', 'NYC'))
+
+# Remove duplicates
+df_with_duplicates = pd.concat([df, df.iloc[0:2]])
+print("\\nDataFrame with duplicates:")
+print(df_with_duplicates)
+
+print("\\nAfter removing duplicates:")
+print(df_with_duplicates.drop_duplicates())
+
+# Data type conversion
+print("\\nCurrent data types:")
+print(df.dtypes)
+
+# Convert Salary to integer (after filling NaN values)
+df_clean = df.copy()
+df_clean['Salary'] = df_clean['Salary'].fillna(0).astype(int)
+print("\\nAfter converting Salary to integer:")
+print(df_clean)
+print(df_clean.dtypes)
+
+# String operations
+print("\\nString operations (uppercase city names):")
+print(df['City'].str.upper())
+
+# Apply custom function to a column
+def age_category(age):
+    if pd.isna(age):
+        return "Unknown"
+    elif age < 30:
+        return "Young"
+    elif age < 40:
+        return "Mid"
+    else:
+        return "Senior"
+
+print("\\nApplying custom function to categorize ages:")
+print(df['Age'].apply(age_category))
+""",
+        dataset="employees({rows}, missing=0.1)",
+    ),
+    # Uses numeric_only=True for groupby mean and explicit column selection
+    Example(
+        id="example8",
+        section="Pandas Operations",
+        title="Data Analysis and Grouping",
+        button="Run Data Analysis Examples",
+        source="""
+import pandas as pd
+import numpy as np
+
+# Create a sample DataFrame with numeric data for analysis
+data = {
+    'Name': ['John', 'Anna', 'Peter', 'Linda', 'Max', 'Sofia', 'Tom', 'Emma'],
+    'Age': [28, 24, 35, 32, 45, 37, 28, 24],
+    'Department': ['Sales', 'Engineering', 'Marketing', 'HR', 'Sales', 'Engineering', 'Marketing', 'HR'],
+    'Salary': [65000, 70000, 80000, 75000, 90000, 85000, 67000, 72000],
+    'Experience': [3, 2, 7, 5, 10, 8, 4, 3],
+    'Gender': ['M', 'F', 'M', 'F', 'M', 'F', 'M', 'F']
+}
+df = pd.DataFrame(data)
+print("Original DataFrame:")
+print(df)
+
+# Grouping data with numeric_only to avoid string column errors
+print("\\nGrouping by Department (mean of numeric columns only):")
+print(df.groupby('Department').mean(numeric_only=True))
+
+print("\\nGrouping by Department and Gender (mean of numeric columns only):")
+print(df.groupby(['Department', 'Gender']).mean(numeric_only=True))
+
+# Aggregation with explicit column selection
+print("\\nMultiple aggregations on numeric columns:")
+result = df.groupby('Department').agg({
+    'Salary': ['mean', 'min', 'max'],
+    'Age': ['mean', 'min', 'max'],
+    'Experience': 'mean'
+})
+print(result)
+
+# Transformation 
+print("\\nCalculating salary deviation from department average:")
+df['Salary_Deviation'] = df['Salary'] - df.groupby('Department')['Salary'].transform('mean')
+print(df[['Name', 'Department', 'Salary', 'Salary_Deviation']])
+
+# Pivot tables with numeric values only
+print("\\nPivot table - Average salary by Department and Gender:")
+pivot = pd.pivot_table(
+    df, 
+    values='Salary',  # Specify only numeric column
+    index='Department', 
+    columns='Gender', 
+    aggfunc='mean'
+)
+print(pivot)
+
+# Crosstab - count of employees by Department and Gender
+print("\\nCrosstab - Count of employees by Department and Gender:")
+crosstab = pd.crosstab(df['Department'], df['Gender'])
+print(crosstab)
+
+# Value counts
+print("\\nCounts of each department:")
+print(df['Department'].value_counts())
+
+# Applying functions to groups
+print("\\nApplying custom function to each department group:")
+def top_earner(group):
+    return group.loc[group['Salary'].idxmax()]
+
+top_earners = df.groupby('Department')[df.columns.tolist()].apply(top_earner)
+print("Top earner in each department:")
+print(top_earners[['Name', 'Department', 'Salary']])
+""",
+        explanation="""
+    **Key Pandas Grouping Operations:**
+
+    * **`groupby()`**: Group DataFrame by one or more columns
+    * **Aggregation**: Compute summary statistics for groups (use `numeric_only=True` to avoid errors with string columns)
+    * **Transformation**: Apply operations while preserving the original DataFrame structure
+    * **Pivot tables**: Reshape and summarize data
+    * **Crosstab**: Compute a cross-tabulation of two or more factors
+
+    **Important Note**: When using `mean()`, `sum()`, and other statistical methods with mixed data types, 
+    specify `numeric_only=True` to prevent errors from attempting calculations on non-numeric data.
+    """,
+        dataset="employees({rows})",
+    ),
+    # Common Errors & Solutions
+    Example(
+        id="error1",
+        section="Common Errors & Solutions",
+        title="1. Syntax Errors in Python",
+        button="Run Error Example 1",
+        source="""
+# Error: Unterminated string literal (missing closing quote)
+message = "Hello, this is a multiline string
+that is not properly closed.
+print(message)
+""",
+        explanation="""
+    **Error**: SyntaxError: EOL while scanning string literal
+
+    **Solution**: Ensure all string literals are properly closed with matching quotes. For multiline strings, use triple quotes:
+    ```python
+    message = '''Hello, this is a properly formatted
+    multiline string.'''
+    print(message)
+    ```
+
+    Or concatenate strings:
+    ```python
+    message = "Hello, this is a " + \\
+              "properly concatenated multiline string."
+    print(message)
+    ```
+    """,
+        error_demo=True,
+    ),
+    Example(
+        id="error2",
+        section="Common Errors & Solutions",
+        title="2. Indentation Errors",
+        button="Run Error Example 2",
+        source="""
+def calculate_average(numbers):
+    total = sum(numbers)
+    count = len(numbers)
+return total / count  # This line should be indented
+
+numbers = [10, 20, 30, 40, 50]
+average = calculate_average(numbers)
+print(f"The average is: {average}")
+""",
+        explanation="""
+    **Error**: IndentationError: expected an indented block
+
+    **Solution**: Python uses indentation to define code blocks. Ensure consistent indentation (typically 4 spaces):
+    ```python
+    def calculate_average(numbers):
+        total = sum(numbers)
+        count = len(numbers)
+        return total / count  # Properly indented
+    ```
+    """,
+        error_demo=True,
+    ),
+    Example(
+        id="error3",
+        section="Common Errors & Solutions",
+        title="3. NumPy Shape Mismatch",
+        button="Run Error Example 3",
+        source="""
+import numpy as np
+
+# Create two arrays with incompatible shapes
+array1 = np.array([[1, 2, 3], [4, 5, 6]])  # Shape: (2, 3)
+array2 = np.array([[7, 8], [9, 10]])       # Shape: (2, 2)
+
+# Attempt to add them together
+result = array1 + array2
+print(result)
+""",
+        explanation="""
+    **Error**: ValueError: operands could not be broadcast together with shapes (2,3) (2,2)
+
+    **Solution**: NumPy operations require compatible shapes. Ensure arrays have compatible dimensions for broadcasting:
+    ```python
+    # Make arrays compatible
+    array1 = np.array([[1, 2, 3], [4, 5, 6]])  # Shape: (2, 3)
+    array2 = np.array([[7, 8, 9], [10, 11, 12]])  # Shape: (2, 3)
+
+    # Now addition works
+    result = array1 + array2
+    ```
+
+    Or reshape one of the arrays to make it compatible:
+    ```python
+    array2_reshaped = array2.reshape(2, 2, 1)  # For specific broadcasting scenarios
+    ```
+    """,
+        error_demo=True,
+    ),
+    Example(
+        id="error4",
+        section="Common Errors & Solutions",
+        title="4. Pandas Key Error",
+        button="Run Error Example 4",
+        source="""
+import pandas as pd
+
+# Create a DataFrame
+data = {'Name': ['John', 'Anna', 'Peter'],
+        'Age': [28, 24, 35],
+        'City': ['New York', 'Paris', 'Berlin']}
+
+df = pd.DataFrame(data)
+
+# Try to access a column that doesn't exist
+result = df['Salary']
+print(result)
+""",
+        explanation="""
+    **Error**: KeyError: 'Salary'
+
+    **Solution**: Check if a column exists before accessing it:
+    ```python
+    if 'Salary' in df.columns:
+        result = df['Salary']
+    else:
+        print("Column 'Salary' does not exist")
+        # Optionally, create the column
+        df['Salary'] = [65000, 70000, 80000]
+    ```
+
+    Or use the `get` method from pandas:
+    ```python
+    result = df.get('Salary', 'Column not found')
+    ```
+    """,
+        error_demo=True,
+    ),
+    Example(
+        id="error5",
+        section="Common Errors & Solutions",
+        title="5. Pandas Chained Assignment Warning",
+        button="Run Error Example 5",
+        source="""
+import pandas as pd
+
+# Create a DataFrame
+data = {'Name': ['John', 'Anna', 'Peter', 'Linda'],
+        'Age': [28, 24, 35, 32],
+        'City': ['New York', 'Paris', 'Berlin', 'London']}
+
+df = pd.DataFrame(data)
+print("Original DataFrame:")
+print(df)
+
+# Chained assignment that may not work as expected
+df[df['Age'] > 30]['City'] = 'Changed'  # This is a chained assignment
+print("\\nAfter attempted modification:")
+print(df)
+""",
+        explanation="""
+    **Warning**: SettingWithCopyWarning: A value is trying to be set on a copy of a slice from a DataFrame
+
+    **Problem**: The change doesn't actually apply to the original DataFrame.
+
+    **Solution**: Use loc for assignments:
+    ```python
+    # Correct way to modify values based on a condition
+    df.loc[df['Age'] > 30, 'City'] = 'Changed'
+    ```
+
+    Or create a copy explicitly if you want to work with a subset:
+    ```python
+    subset = df[df['Age'] > 30].copy()
+    subset['City'] = 'Changed'
+    ```
+    """,
+    ),
+    Example(
+        id="error6",
+        section="Common Errors & Solutions",
+        title="6. TypeError in Pandas Calculations with Mixed Types",
+        button="Run Error Example 6",
+        source="""
+import pandas as pd
+
+# Create a DataFrame with mixed types
+data = {
+    'Name': ['John', 'Anna', 'Peter', 'Linda'],
+    'Age': [28, 24, 35, 32],
+    'City': ['New York', 'Paris', 'Berlin', 'London'],
+    'Salary': [65000, 70000, 80000, 75000]
+}
+df = pd.DataFrame(data)
+
+# Attempt to calculate mean of all columns including non-numeric ones
+print(df.groupby('City').mean())  # This will cause an error
+""",
+        explanation="""
+    **Error**: TypeError: agg function failed [how->mean,dtype->object]
+
+    **Solution**: Specify numeric_only=True when using statistical methods with DataFrames containing mixed types:
+    ```python
+    # Correct way to calculate mean on mixed type DataFrames
+    print(df.groupby('City').mean(numeric_only=True))
+    ```
+
+    Or select specific numeric columns manually:
+    ```python
+    print(df.groupby('City')[['Age', 'Salary']].mean())
+    ```
+    """,
+        error_demo=True,
+    ),
+]
@@ -0,0 +1,192 @@
+"""Synthetic "employees" table used by the pandas examples, at any scale
+
+``employees(rows)`` returns the Name/Age/City/Department/Salary/Experience/Gender
+table the examples write out by hand, generated with NumPy in chunks of
+``CHUNK_ROWS`` so that 10^8 rows never need more than one chunk of scratch
+memory. The same ``rows``, ``seed`` and ``missing`` always give the same table.
+
+When pyarrow is installed the table is written once to an Arrow IPC (Feather v2)
+file under ``RUNNER_DATASET_DIR`` (default ``.runner_cache/datasets``) with its
+string columns dictionary-encoded, and later calls read that file through a
+memory map instead of generating the table again. Converting it to pandas still
+copies every column into the DataFrame: snippets modify their tables in place,
+and pandas cannot write to Arrow's read-only buffers. Without pyarrow the table
+is generated in memory on every call.
+"""
+import os
+from pathlib import Path
+
+# Bump when the generator changes so stale files are not reused
+VERSION = 1
+CHUNK_ROWS = 1_000_000
+# Size the labs measure the examples at unless another one is chosen
+MEASURE_ROWS = 100_000
+# Rough cost of an example on the table: about 100 bytes a row with object string
+# columns, times the copies the examples make, at about a million rows a second
+BYTES_PER_ROW = 800
+ROWS_PER_SECOND = 1_000_000
+
+ROOT = Path(__file__).resolve().parent.parent
+DATASET_DIR = Path(os.environ.get("RUNNER_DATASET_DIR", ROOT / ".runner_cache" / "datasets"))
+
+# Alternating male and female names, so a name's parity is its gender code
+NAMES = (
+    "John", "Anna", "Peter", "Linda", "Max", "Sofia", "Tom", "Emma", "David", "Maria",
+    "James", "Laura", "Michael", "Sarah", "Daniel", "Julia", "Lucas", "Chloe", "Omar", "Lina",
+)
+CITIES = ("New York", "Paris", "Berlin", "London", "Tokyo", "Madrid")
+DEPARTMENTS = ("Sales", "Engineering", "Marketing", "HR")
+GENDERS = ("M", "F")
+BASE_SALARY = (52000, 65000, 54000, 50000)  # by department, in DEPARTMENTS order
+
+COLUMNS = ("Name", "Age", "City", "Department", "Salary", "Experience", "Gender")
+# Columns that get missing values when ``missing`` is set, as in the data cleaning example
+NULLABLE = ("Name", "Age", "City", "Salary")
+
+
+def _chunk(start, stop, seed, missing):
+    """Columns of rows [start, stop) as {name: (values or codes, categories)} plus null masks"""
+    import numpy as np
+
+    rng = np.random.default_rng([seed, start // CHUNK_ROWS])
+    n = stop - start
+    gender = rng.integers(0, len(GENDERS), n, dtype=np.int8)
+    name = (rng.integers(0, len(NAMES) // 2, n, dtype=np.int8) * 2 + gender).astype(np.int8)
+    age = rng.integers(22, 65, n)
+    experience = np.maximum(age - 22 - rng.integers(0, 6, n), 0)
+    department = rng.integers(0, len(DEPARTMENTS), n, dtype=np.int8)
+    city = rng.integers(0, len(CITIES), n, dtype=np.int8)
+    salary = np.asarray(BASE_SALARY)[department] + 1500 * experience + rng.normal(0, 5000, n)
+    columns = {
+        "Name": (name, NAMES),
+        "Age": (age, None),
+        "City": (city, CITIES),
+        "Department": (department, DEPARTMENTS),
+        "Salary": (np.round(salary, -2).astype(np.int64), None),
+        "Experience": (experience, None),
+        "Gender": (gender, GENDERS),
+    }
+    masks = {column: rng.random(n) < missing for column in NULLABLE} if missing else {}
+    return columns, masks
+
+
+def _chunks(rows, seed, missing):
+    for start in range(0, rows, CHUNK_ROWS):
+        yield _chunk(start, min(start + CHUNK_ROWS, rows), seed, missing)
+
+
+def generate(rows, seed=0, missing=0.0, categorical=False):
+    """Build the table in memory with pandas; string columns are ``category`` if ``categorical``"""
+    import numpy as np
+    import pandas as pd
+
+    parts = []
+    for columns, masks in _chunks(rows, seed, missing):
+        data = {}
+        for column in COLUMNS:
+            values, categories = columns[column]
+            mask = masks.get(column)
+            if categories is not None:
+                codes = values.astype(np.int16)
+                if mask is not None:
+                    codes[mask] = -1
+                series = pd.Categorical.from_codes(codes, categories)
+                data[column] = series if categorical else np.asarray(series, dtype=object)
+            elif mask is not None:
+                data[column] = np.where(mask, np.nan, values)
+            else:
+                data[column] = values
+        parts.append(pd.DataFrame(data))
+    if not parts:
+        return pd.DataFrame({column: [] for column in COLUMNS})
+    return pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+
+
+def _batch(columns, masks):
+    import pyarrow as pa
+
+    arrays = []
+    for column in COLUMNS:
+        values, categories = columns[column]
+        array = pa.array(values, mask=masks.get(column))
+        if categories is not None:
+            array = pa.DictionaryArray.from_arrays(array, pa.array(categories))
+        arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, names=list(COLUMNS))
+
+
+def dataset_path(rows, seed=0, missing=0.0):
+    return DATASET_DIR / f"employees-v{VERSION}-{rows}-seed{seed}-missing{missing:g}.arrow"
+
+
+def fits(rows, limits):
+    """Whether an example on ``rows`` rows of the table can finish within ``limits``"""
+    if limits.memory_bytes and rows * BYTES_PER_ROW > limits.memory_bytes:
+        return False
+    return not limits.wall_seconds or rows / ROWS_PER_SECOND < limits.wall_seconds
+
+
+def _remove_stale(path):
+    """Delete partial files left next to ``path`` by writers that were killed"""
+    for tmp in path.parent.glob(f"{path.name}.*.tmp"):
+        pid = tmp.suffixes[-2].lstrip(".")
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            tmp.unlink(missing_ok=True)
+        except (ValueError, OSError):
+            pass
+
+
+def ensure_file(rows, seed=0, missing=0.0):
+    """Path of the cached Arrow file for these parameters, writing it first if needed"""
+    import pyarrow as pa
+
+    path = dataset_path(rows, seed, missing)
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _remove_stale(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    writer = None
+    try:
+        try:
+            for columns, masks in _chunks(rows, seed, missing):
+                batch = _batch(columns, masks)
+                if writer is None:
+                    writer = pa.ipc.new_file(str(tmp), batch.schema)
+                writer.write_batch(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+    except BaseException:
+        # Includes the runner's limit errors, which interrupt large tables midway
+        tmp.unlink(missing_ok=True)
+        raise
+    if writer is None:
+        return None  # zero rows: nothing worth caching
+    os.replace(tmp, path)
+    return path
+
+
+def employees(rows=1000, seed=0, missing=0.0, categorical=False):
+    """The employees table with ``rows`` rows as a DataFrame
+
+    ``missing`` is the fraction of Name, Age, City and Salary values left empty.
+    String columns come back as plain object columns unless ``categorical``.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return generate(rows, seed, missing, categorical)
+    path = ensure_file(rows, seed, missing)
+    if path is None:
+        return generate(rows, seed, missing, categorical)
+    # to_pandas() copies out of the mapping, so the frame stays writable
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    if not categorical:
+        table = table.cast(pa.schema([
+            (field.name, field.type.value_type if pa.types.is_dictionary(field.type) else field.type)
+            for field in table.schema
+        ]))
+    return table.to_pandas()
@@ -0,0 +1,113 @@
+"""Memory report and dtype downcasts for the DataFrames a snippet builds
+
+``report_source`` builds a snippet that runs an example's code, finds the
+DataFrames left in its namespace and prints each column's dtype and
+``memory_usage(deep=True)`` together with a smaller dtype when one fits:
+``category`` for strings with few distinct values, the smallest integer type
+for integers, and the smallest nullable integer type for floats holding only
+whole numbers and missing values. ``apply_source`` converts one DataFrame to the
+proposed dtypes and times a groupby-mean on it before and after. Both run
+through the normal execution pipeline, like the other labs.
+"""
+import json
+
+from examples.vectorization import MEASURE
+
+# Strings become categories when at most this fraction of the rows are distinct values
+MAX_CATEGORY_RATIO = 0.5
+
+COMMON = """\
+import contextlib, io, json, timeit
+import numpy as np
+import pandas as pd
+
+# The snippet, with its printing silenced, in a namespace of its own
+namespace = {{"__name__": "__main__"}}
+with contextlib.redirect_stdout(io.StringIO()):
+    exec({source!r}, namespace)
+frames = {{
+    name: value for name, value in namespace.items()
+    if isinstance(value, pd.DataFrame) and not name.startswith("_")
+}}
+
+def proposal(series):
+    if series.dtype == object:
+        values = series.dropna()
+        if len(values) and values.map(type).eq(str).all() and series.nunique() <= {ratio} * len(series):
+            return "category"
+    elif pd.api.types.is_integer_dtype(series) and isinstance(series.dtype, np.dtype):
+        smaller = pd.to_numeric(series, downcast="integer").dtype
+        if smaller != series.dtype:
+            return smaller.name
+    elif pd.api.types.is_float_dtype(series):
+        values = series.dropna()
+        if len(values) and (values == values.round()).all():
+            # Whole numbers stored as floats because of missing values
+            return pd.to_numeric(values, downcast="integer").dtype.name.capitalize()
+    return None
+"""
+
+REPORT = COMMON + """
+report = {{}}
+for name, frame in frames.items():
+    columns = []
+    for i, column in enumerate(frame.columns):
+        series = frame.iloc[:, i]
+        dtype = proposal(series)
+        columns.append({{
+            "column": str(column),
+            "dtype": str(series.dtype),
+            "bytes": int(series.memory_usage(deep=True, index=False)),
+            "proposed": dtype,
+            "proposed_bytes": int(series.astype(dtype).memory_usage(deep=True, index=False)) if dtype else None,
+        }})
+    report[name] = {{"rows": len(frame), "index_bytes": int(frame.index.memory_usage(deep=True)), "columns": columns}}
+print(json.dumps(report))
+"""
+
+APPLY = COMMON + """
+{measure}
+before = frames[{name!r}]
+dtypes = {{column: dtype for column, dtype in ((c, proposal(before[c])) for c in before.columns) if dtype}}
+after = before.astype(dtypes)
+result = {{
+    "dtypes": dtypes,
+    "before_bytes": int(before.memory_usage(deep=True).sum()),
+    "after_bytes": int(after.memory_usage(deep=True).sum()),
+}}
+# Average the numeric columns by the first column that became a category
+keys = [column for column, dtype in dtypes.items() if dtype == "category"]
+numeric = before.select_dtypes("number").columns.tolist()
+if keys and numeric:
+    key = keys[0]
+    group = "frame.groupby(key, observed=True)[numeric].mean()"
+    frame = before
+    result["groupby_before"] = measure(group)
+    frame = after
+    result["groupby_after"] = measure(group)
+    result["groupby"] = f"{name}.groupby({{key!r}})[{{numeric!r}}].mean()"
+print(json.dumps(result))
+"""
+
+
+def report_source(source):
+    """Snippet printing the memory report of the DataFrames ``source`` leaves behind"""
+    return REPORT.format(source=source, ratio=MAX_CATEGORY_RATIO)
+
+
+def apply_source(source, name):
+    """Snippet converting DataFrame ``name`` of ``source`` to the proposed dtypes and timing a groupby"""
+    return APPLY.format(source=source, ratio=MAX_CATEGORY_RATIO, measure=MEASURE, name=name)
+
+
+def parse(result):
+    """The JSON a report or apply snippet printed"""
+    return json.loads(result.output.strip().splitlines()[-1])
+
+
+def human(size):
+    """``size`` bytes for display"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.1f} {unit}"
+        size /= 1024
@@ -0,0 +1,57 @@
+"""Data model of the example registry"""
+import re
+import zlib
+from dataclasses import dataclass
+
+# The hand-written sample table that scalable examples start with
+SAMPLE_TABLE = re.compile(r"^data = \{\n.*?^\}\ndf = pd\.DataFrame\(data\)$", re.MULTILINE | re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Section:
+    """A sidebar topic; ``header`` and ``intro`` are rendered above its examples"""
+    title: str
+    header: str = ""
+    intro: str = ""
+
+
+@dataclass(frozen=True)
+class Example:
+    """A runnable snippet together with the text shown around it
+
+    ``determinism`` is "pure" when the output is the same on every run,
+    "seeded" when it is only reproducible with seeded random generators and a
+    frozen clock (runner.determinism), and "volatile" otherwise.
+    ``error_demo`` examples are expected to raise. ``dataset`` is set on
+    examples whose sample table can be swapped for generated rows: a call to
+    ``examples.datasets.employees`` with a ``{rows}`` placeholder. ``lab`` names
+    an interactive panel shown with the example ("vectorization").
+    """
+    id: str
+    section: str
+    title: str
+    button: str
+    source: str
+    explanation: str = ""
+    correction: str = ""
+    determinism: str = "pure"
+    error_demo: bool = False
+    dataset: str = ""
+    lab: str = ""
+
+    @property
+    def deterministic(self):
+        """Whether runs of the example are reproducible and may be served from caches"""
+        return self.determinism != "volatile"
+
+    @property
+    def seed(self):
+        """Seed of a "seeded" example's runs, stable across processes; None otherwise"""
+        return zlib.crc32(self.id.encode()) if self.determinism == "seeded" else None
+
+    def scaled(self, rows):
+        """The source with its sample table replaced by ``rows`` generated rows"""
+        if not self.dataset:
+            return self.source
+        replacement = f"from examples.datasets import employees\ndf = {self.dataset.format(rows=rows)}"
+        return SAMPLE_TABLE.sub(lambda match: replacement, self.source, count=1)
@@ -0,0 +1,119 @@
+"""Vectorization lab: Python loops vs the math module vs NumPy, measured
+
+Each operation of the "Array Operations" example has up to three equivalent
+implementations. ``harness_source`` builds a snippet that times them at one size
+with an auto-ranging ``timeit`` harness and prints the timings as JSON. The apps
+run it through the normal execution pipeline, so measurements happen in a worker
+and the result cache, keyed by the snippet and the Python/NumPy versions,
+remembers each (operation, size) pair.
+"""
+import json
+import math
+
+SIZES = [10 ** k for k in range(1, 8)]
+IMPLEMENTATIONS = ("list comprehension", "math module", "NumPy")
+
+# Python implementations are skipped above this many element operations; they would
+# take seconds per call and run into the wall-clock limit
+MAX_PYTHON_WORK = 2 * 10 ** 6
+
+# operation -> (matrix operation?, {implementation: statement, or None if there is none})
+OPERATIONS = {
+    "a + b": (False, {
+        "list comprehension": "[x + y for x, y in zip(a, b)]",
+        "math module": None,
+        "NumPy": "x + y",
+    }),
+    "a ** 2": (False, {
+        "list comprehension": "[v ** 2 for v in a]",
+        "math module": "[math.pow(v, 2) for v in a]",
+        "NumPy": "x ** 2",
+    }),
+    "sqrt(a)": (False, {
+        "list comprehension": "[v ** 0.5 for v in a]",
+        "math module": "[math.sqrt(v) for v in a]",
+        "NumPy": "np.sqrt(x)",
+    }),
+    "exp(a)": (False, {
+        "list comprehension": "[math.e ** v for v in a]",
+        "math module": "[math.exp(v) for v in a]",
+        "NumPy": "np.exp(x)",
+    }),
+    "dot(a, b)": (False, {
+        "list comprehension": "sum([v * w for v, w in zip(a, b)])",
+        "math module": "math.fsum(map(operator.mul, a, b))",
+        "NumPy": "np.dot(x, y)",
+    }),
+    "A @ B": (True, {
+        "list comprehension": "[[sum([p * q for p, q in zip(row, col)]) for col in Bt] for row in A]",
+        "math module": "[[math.fsum(map(operator.mul, row, col)) for col in Bt] for row in A]",
+        "NumPy": "X @ Y",
+    }),
+}
+
+# Timing function shared by the measuring snippets of the labs
+MEASURE = """\
+def measure(stmt):
+    # Like timeit's command line: enough loops for 0.2 s, best of three
+    timer = timeit.Timer(stmt, globals=globals())
+    number, total = timer.autorange()
+    return min([total, *timer.repeat(repeat=2, number=number)]) / number
+"""
+
+HARNESS = """\
+import json, math, operator, timeit
+import numpy as np
+
+n = {n}
+{setup}
+
+{measure}
+timings = {{}}
+for name, stmt in {statements!r}:
+    timings[name] = measure(stmt) if stmt else None
+print(json.dumps(timings))
+"""
+
+# (NumPy operands, the same data as lists for the Python implementations)
+VECTOR_SETUP = (
+    "x = np.arange(n) % 100 + 1.0\ny = x[::-1].copy()",
+    "a, b = x.tolist(), y.tolist()",
+)
+MATRIX_SETUP = (
+    "m = math.isqrt(n)\nX = (np.arange(m * m) % 100 + 1.0).reshape(m, m)\nY = X.T.copy()",
+    "A, Bt = X.tolist(), Y.T.tolist()",
+)
+
+
+def work(operation, size):
+    """Element operations one call of ``operation`` performs at ``size``"""
+    matrix, _ = OPERATIONS[operation]
+    return math.isqrt(size) ** 3 if matrix else size
+
+
+def harness_source(operation, size):
+    """Snippet timing every implementation of ``operation`` on ``size`` elements"""
+    matrix, statements = OPERATIONS[operation]
+    python = work(operation, size) <= MAX_PYTHON_WORK
+    timed = [
+        (name, stmt if python or name == "NumPy" else None)
+        for name, stmt in statements.items()
+    ]
+    arrays, lists = MATRIX_SETUP if matrix else VECTOR_SETUP
+    setup = f"{arrays}\n{lists}" if python else arrays
+    return HARNESS.format(n=size, setup=setup, measure=MEASURE, statements=timed)
+
+
+def parse(result):
+    """Seconds per call of each implementation (None where not measured) from a harness result"""
+    return json.loads(result.output.strip().splitlines()[-1])
+
+
+def speedups(timings):
+    """How many times faster NumPy was than each other measured implementation"""
+    numpy_seconds = timings.get("NumPy")
+    return {
+        name: seconds / numpy_seconds
+        for name, seconds in timings.items()
+        if name != "NumPy" and seconds and numpy_seconds
+    }
@@ -0,0 +1,8 @@
+"""Shared snippet execution support for the Streamlit teaching apps"""
+from runner.backends import InProcessBackend, ProcessPoolBackend, get_backend, set_backend, warm_up
+from runner.cache import RESULT_CACHE, ResultCache, snippet_key
+from runner.core import execute
+from runner.kernel import KERNELS
+from runner.snapshot import load_snapshot
+from runner.telemetry import TELEMETRY
+from runner.worker import ExecutionResult, run_snippet
@@ -0,0 +1,330 @@
+"""Execution backends: where a snippet actually runs
+
+``InProcessBackend`` executes in the Streamlit server process. ``ProcessPoolBackend``
+sends snippets to long-lived worker processes that imported numpy and pandas at
+start-up, so a heavy example holds a worker's GIL instead of the server's.
+Select one with ``RUNNER_BACKEND=inprocess|process`` and size the pool with
+``RUNNER_WORKERS``.
+
+Long-lived workers keep the heap they grew: a worker is retired after
+``RUNNER_WORKER_MAX_RUNS`` runs or once its peak RSS reaches
+``RUNNER_WORKER_MAX_RSS_BYTES`` (0 disables either). It keeps serving until its
+replacement has started and preloaded its modules, so no request waits for a
+cold worker or is dropped. Crashed and timed-out workers are replaced too, and
+starts that fail are retried, so the pool returns to ``RUNNER_WORKERS`` workers.
+A request that finds no free worker within ``RUNNER_CHECKOUT_SECONDS`` gets a
+``WorkerUnavailable`` error instead of waiting forever.
+
+Workers are never forked from the server, whose other threads may hold locks
+that a forked child would inherit forever. Where available they fork from a
+``forkserver`` that preloads ``PRELOAD_MODULES`` once; elsewhere they are
+spawned. A worker that has not started within ``RUNNER_WORKER_START_SECONDS``
+counts as a failed start.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+from runner import telemetry
+from runner.config import env_int
+from runner.incremental import run_incremental
+from runner.worker import ExecutionResult, run_snippet
+
+# Extra seconds the server waits past the wall limit before killing a worker;
+# covers workers stuck in C code where the in-worker timer cannot interrupt.
+HARD_TIMEOUT_GRACE = 2
+
+PRELOAD_MODULES = ("numpy", "pandas")
+
+# Longest wait for a free pool worker, and for a new worker to preload its modules
+CHECKOUT_SECONDS = env_int("RUNNER_CHECKOUT_SECONDS", 120)
+START_SECONDS = env_int("RUNNER_WORKER_START_SECONDS", 60)
+# Seconds between attempts to start a worker, doubling up to the maximum
+RESTART_DELAY, MAX_RESTART_DELAY = 1, 30
+
+
+CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+if CONTEXT.get_start_method() == "forkserver":
+    CONTEXT.set_forkserver_preload(["runner.backends", *PRELOAD_MODULES])
+
+
+def preload_modules():
+    """Import PRELOAD_MODULES that are installed, so snippets do not pay for them"""
+    for name in PRELOAD_MODULES:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+
+def _serve(conn):
+    preload_modules()
+    conn.send(os.getpid())
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        source, limits, seed, incremental = request
+        conn.send(run_incremental(source, limits) if incremental else run_snippet(source, limits, seed))
+
+
+# Failures of the machinery rather than outcomes of the snippet; never cached
+BACKEND_ERRORS = frozenset({"WorkerCrashed", "WorkerUnavailable", "KernelsBusy"})
+
+
+def backend_error(error_type, message):
+    """An ExecutionResult, without output, for a run the backend killed or could not start"""
+    return ExecutionResult("", error_type=error_type, error_message=message, traceback=f"{error_type}: {message}\n")
+
+
+def is_backend_error(result):
+    return result.error_type in BACKEND_ERRORS
+
+
+class InProcessBackend:
+    """Run snippets directly in the calling thread; only the output limit applies"""
+
+    def run(self, source, limits, seed=None, incremental=False):
+        if incremental:
+            return run_incremental(source, limits.output_only())
+        return run_snippet(source, limits.output_only(), seed)
+
+    def shutdown(self):
+        pass
+
+
+class _Worker:
+    """A pool worker process and the pipe to it"""
+
+    def __init__(self):
+        self.pid = None
+        self.runs = 0
+        self.peak_rss_bytes = 0
+        self.retiring = False  # a replacement is warming up
+        self.retired = False  # the replacement is in service; stop at the next checkout
+        self._conn, child = CONTEXT.Pipe()
+        self._process = CONTEXT.Process(target=_serve, args=(child,), name="runner-worker", daemon=True)
+        self._process.start()
+        child.close()
+
+    def wait_ready(self, timeout=START_SECONDS):
+        """Wait until the worker has preloaded its modules; raises EOFError if it died, TimeoutError if it hung"""
+        if not self._conn.poll(timeout or None):
+            raise TimeoutError(f"worker did not start within {timeout} s")
+        self.pid = self._conn.recv()
+
+    def call(self, request, timeout):
+        """Run ``request`` and return the result, or None on timeout; raises EOFError/OSError if the worker died"""
+        self._conn.send(request)
+        if not self._conn.poll(timeout):
+            return None
+        return self._conn.recv()
+
+    def stop(self, kill=False):
+        if not kill:
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.kill()
+        self._process.join()
+        self._conn.close()
+
+
+class ProcessPoolBackend:
+    """Run snippets in a pool of pre-warmed worker processes, recycling worn-out ones"""
+
+    def __init__(self, workers=None, max_runs=0, max_rss_bytes=0, checkout_seconds=CHECKOUT_SECONDS):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_runs = max_runs
+        self.max_rss_bytes = max_rss_bytes
+        self.checkout_seconds = checkout_seconds
+        self._lock = threading.Lock()
+        self._idle = queue.SimpleQueue()
+        self._live = set()
+        self._pending = 0  # replacements being started
+        self._closed = False
+        # Spawn every worker now so the imports are paid before the first click
+        started = [_Worker() for _ in range(self.workers)]
+        for worker in started:
+            try:
+                worker.wait_ready()
+            except (EOFError, OSError):
+                worker.stop(kill=True)
+                continue
+            self._live.add(worker)
+            self._idle.put(worker)
+        self._replenish("startup")
+
+    def _checkout(self):
+        """An idle worker, or None if none became free within ``checkout_seconds``"""
+        deadline = time.monotonic() + self.checkout_seconds if self.checkout_seconds else None
+        while True:
+            try:
+                worker = self._idle.get(timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return None
+            if not worker.retired:
+                return worker
+            self._discard(worker)
+
+    def _discard(self, worker, kill=False):
+        with self._lock:
+            self._live.discard(worker)
+        threading.Thread(target=worker.stop, args=(kill,), daemon=True).start()
+
+    def _start(self, reason):
+        delay = RESTART_DELAY
+        while True:
+            worker = _Worker()
+            try:
+                worker.wait_ready()
+                break
+            except (EOFError, OSError):
+                worker.stop(kill=True)
+            with self._lock:
+                if self._closed:
+                    self._pending -= 1
+                    return
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_RESTART_DELAY)
+        with self._lock:
+            self._pending -= 1
+            if self._closed:
+                worker.stop()
+                return
+            self._live.add(worker)
+            # Take over from a worker waiting to be retired, if there is one
+            old = next((w for w in self._live if w.retiring and not w.retired), None)
+            if old is not None:
+                old.retired = True
+        telemetry.TELEMETRY.record_worker_replacement(reason)
+        self._idle.put(worker)
+
+    def _replenish(self, reason):
+        """Start workers until those in service plus those starting make up ``workers``
+
+        ``reason`` is why workers are missing, as reported to TELEMETRY: "recycled",
+        "crashed", "timeout" or "startup" (a worker of the initial pool failed to start).
+        """
+        with self._lock:
+            if self._closed:
+                return
+            # Retiring workers already have a replacement counted in _pending
+            serving = sum(1 for w in self._live if not w.retiring)
+            missing = max(self.workers - serving - self._pending, 0)
+            self._pending += missing
+        for _ in range(missing):
+            threading.Thread(target=self._start, args=(reason,), name="runner-worker-start", daemon=True).start()
+
+    def _worn_out(self, worker):
+        return ((self.max_runs and worker.runs >= self.max_runs)
+                or (self.max_rss_bytes and worker.peak_rss_bytes >= self.max_rss_bytes))
+
+    def run(self, source, limits, seed=None, incremental=False):
+        """Run ``source`` in an idle worker; ``incremental`` runs use that worker's statement cache"""
+        worker = self._checkout()
+        if worker is None:
+            return backend_error("WorkerUnavailable", f"no worker became free within {self.checkout_seconds} s; try again shortly")
+        timeout = limits.wall_seconds + HARD_TIMEOUT_GRACE if limits.wall_seconds else None
+        try:
+            result = worker.call((source, limits, seed, incremental), timeout)
+        except (EOFError, OSError):
+            self._discard(worker, kill=True)
+            self._replenish("crashed")
+            return backend_error("WorkerCrashed", "the worker process running this code exited unexpectedly")
+        if result is None:
+            # The worker cannot be interrupted from here, so stop it and warm up a new one
+            self._discard(worker, kill=True)
+            self._replenish("timeout")
+            return backend_error("TimeLimitExceeded", f"wall-clock limit of {limits.wall_seconds} s exceeded")
+        worker.runs += 1
+        # The worker's peak is the highest of its runs' peaks
+        worker.peak_rss_bytes = max(worker.peak_rss_bytes, (result.metrics or {}).get("peak_rss_bytes", 0))
+        if worker.retired:
+            self._discard(worker)
+            return result
+        if not worker.retiring and self._worn_out(worker):
+            # Keep serving with this worker until its replacement is warm
+            worker.retiring = True
+            self._replenish("recycled")
+        self._idle.put(worker)
+        return result
+
+    def stats(self):
+        """Pid, run count and peak RSS of every live worker not yet retired"""
+        with self._lock:
+            return [
+                {"pid": w.pid, "runs": w.runs, "peak_rss_bytes": w.peak_rss_bytes, "retiring": w.retiring}
+                for w in self._live if not w.retired
+            ]
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            workers, self._live = list(self._live), set()
+        for worker in workers:
+            threading.Thread(target=worker.stop, daemon=True).start()
+
+
+BACKENDS = {
+    "inprocess": InProcessBackend,
+    "process": lambda: ProcessPoolBackend(
+        env_int("RUNNER_WORKERS", 0) or None,
+        max_runs=env_int("RUNNER_WORKER_MAX_RUNS", 500),
+        max_rss_bytes=env_int("RUNNER_WORKER_MAX_RSS_BYTES", 1024 * 1024 * 1024),
+    ),
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the process-wide backend, creating it from RUNNER_BACKEND on first use"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = BACKENDS[os.environ.get("RUNNER_BACKEND", "process")]()
+    return _backend
+
+
+def set_backend(backend):
+    """Replace the process-wide backend, shutting down the previous one"""
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, backend
+    if previous is not None:
+        previous.shutdown()
+
+
+_warm_up_thread = None
+_warm_up_lock = threading.Lock()
+
+
+def _warm_up():
+    telemetry.start_exporters()
+    if isinstance(get_backend(), InProcessBackend):
+        preload_modules()
+
+
+def warm_up():
+    """Start the backend and preload numpy/pandas in a background thread, once per process
+
+    Lets the apps paint without waiting for worker start-up or heavy imports,
+    which then finish while the user is still reading.
+    """
+    global _warm_up_thread
+    with _warm_up_lock:
+        if _warm_up_thread is None:
+            _warm_up_thread = threading.Thread(target=_warm_up, name="runner-warm-up", daemon=True)
+            _warm_up_thread.start()
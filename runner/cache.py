@@ -0,0 +1,101 @@
+"""Content-addressed cache of snippet results shared by every session in the process"""
+import dataclasses
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from importlib import metadata
+
+from runner.config import env_int
+
+
+def _library_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "missing"
+
+
+# Results depend on the interpreter and library versions, so they are part of every key.
+# importlib.metadata reads the versions without importing numpy or pandas.
+RUNTIME_TAG = "python={} numpy={} pandas={}".format(
+    sys.version.split()[0], _library_version("numpy"), _library_version("pandas")
+)
+
+
+def snippet_key(source, seed=None):
+    """Return the cache key of a snippet: a hash of its source, seed and the runtime versions"""
+    digest = hashlib.sha256()
+    digest.update(RUNTIME_TAG.encode())
+    digest.update(b"\0" + str(seed).encode() + b"\0")
+    digest.update(source.encode())
+    return digest.hexdigest()
+
+
+def _result_size(value):
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    if dataclasses.is_dataclass(value):
+        return sys.getsizeof(value) + _result_size(dataclasses.astuple(value))
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_result_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_result_size(item) for item in value.values())
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by both entry count and approximate memory"""
+
+    def __init__(self, max_entries=256, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached result for ``key`` or None, marking it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """Store ``value`` under ``key``, evicting least recently used entries over the limits"""
+        size = _result_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+# Module state survives Streamlit reruns, so this one instance is shared by all sessions.
+RESULT_CACHE = ResultCache(
+    max_entries=env_int("RUNNER_CACHE_MAX_ENTRIES", 256),
+    max_bytes=env_int("RUNNER_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+)
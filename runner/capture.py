@@ -0,0 +1,155 @@
+"""Per-execution stdout capture that is safe across concurrent sessions
+
+Swapping ``sys.stdout`` for each run lets one session's prints land in another
+session's buffer when snippets execute in parallel threads. Instead a single
+proxy is installed as ``sys.stdout`` and forwards every write to the buffer
+registered in the current context, or to the original stream when none is.
+
+Captured output is bounded: ``BoundedCapture`` keeps the first and last
+``RUNNER_CAPTURE_HEAD_BYTES``/``RUNNER_CAPTURE_TAIL_BYTES`` and counts what was
+dropped in between. Unless ``RUNNER_SPILL_OUTPUT=0``, output that overflows is
+also written in full to a temporary file the user can download; only the newest
+``RUNNER_SPILL_MAX_FILES`` such files are kept.
+"""
+import contextvars
+import io
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from runner.config import env_int
+from runner.limits import OutputLimitExceeded
+
+HEAD_BYTES = env_int("RUNNER_CAPTURE_HEAD_BYTES", 32 * 1024)
+TAIL_BYTES = env_int("RUNNER_CAPTURE_TAIL_BYTES", 32 * 1024)
+SPILL_OUTPUT = env_int("RUNNER_SPILL_OUTPUT", 1) != 0
+SPILL_MAX_FILES = env_int("RUNNER_SPILL_MAX_FILES", 50)
+SPILL_DIR = Path(tempfile.gettempdir()) / "runner-output"
+
+_target = contextvars.ContextVar("runner_stdout_target", default=None)
+_install_lock = threading.Lock()
+
+
+class StdoutProxy:
+    """File-like object routing writes to the current context's capture buffer"""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+
+    def _stream(self):
+        stream = _target.get()
+        return self._fallback if stream is None else stream
+
+    def write(self, s):
+        return self._stream().write(s)
+
+    def writelines(self, lines):
+        return self._stream().writelines(lines)
+
+    def flush(self):
+        return self._stream().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream(), name)
+
+
+def install():
+    """Make ``sys.stdout`` the routing proxy; safe to call repeatedly"""
+    with _install_lock:
+        if not isinstance(sys.stdout, StdoutProxy):
+            sys.stdout = StdoutProxy(sys.stdout)
+
+
+@contextmanager
+def capture(buffer):
+    """Send prints from the current context to ``buffer`` for the duration of the block"""
+    install()
+    token = _target.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _target.reset(token)
+
+
+def _prune_spills():
+    files = sorted(SPILL_DIR.glob("*.txt"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for stale in files[SPILL_MAX_FILES:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+class BoundedCapture(io.TextIOBase):
+    """Text sink keeping only the head and tail of what is written
+
+    Memory stays under ``head_bytes + tail_bytes`` however much a snippet prints.
+    Writing more than ``max_bytes`` in total raises OutputLimitExceeded. With
+    ``spill`` set, the complete output is copied to a temporary file as soon as
+    anything would be dropped; ``spill_path`` names it.
+    """
+
+    def __init__(self, head_bytes=HEAD_BYTES, tail_bytes=TAIL_BYTES, max_bytes=None, spill=SPILL_OUTPUT):
+        self.head_bytes = head_bytes
+        self.tail_bytes = tail_bytes
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.spill_path = None
+        self.written = 0
+        self.dropped = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._spill_file = None
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        data = s.encode("utf-8", "replace")
+        if self.max_bytes and self.written + len(data) > self.max_bytes:
+            self._append(data[:self.max_bytes - self.written])
+            raise OutputLimitExceeded(f"output limit of {self.max_bytes} bytes exceeded")
+        self._append(data)
+        return len(s)
+
+    def _append(self, data):
+        self.written += len(data)
+        room = self.head_bytes - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if not data:
+            return
+        overflow = len(self._tail) + len(data) - self.tail_bytes
+        if overflow > 0 and self.spill and self._spill_file is None:
+            self._start_spill()
+        if self._spill_file is not None:
+            self._spill_file.write(data)
+        self._tail += data
+        if overflow > 0:
+            del self._tail[:overflow]
+            self.dropped += overflow
+
+    def _start_spill(self):
+        # Nothing was dropped yet, so head and tail still hold everything written so far
+        SPILL_DIR.mkdir(parents=True, exist_ok=True)
+        _prune_spills()
+        fd, path = tempfile.mkstemp(prefix="output-", suffix=".txt", dir=SPILL_DIR)
+        self._spill_file = os.fdopen(fd, "wb")
+        self._spill_file.write(self._head + self._tail)
+        self.spill_path = path
+
+    def close(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+        super().close()
+
+    def getvalue(self):
+        head = self._head.decode("utf-8", "ignore")
+        tail = self._tail.decode("utf-8", "ignore")
+        if not self.dropped:
+            return head + tail
+        return f"{head}\n\n... [{self.dropped} bytes of output omitted] ...\n\n{tail}"
@@ -0,0 +1,101 @@
+"""Cache of compiled snippet code objects
+
+``compile_snippet`` parses each distinct source once per process. Sources that
+fail to parse keep their SyntaxError, so error examples never re-enter the
+parser either. Setting ``RUNNER_BYTECODE_DIR`` also stores the code objects as
+marshalled files, which lets pool workers and restarted servers skip
+compilation. Keys and the on-disk directory include the bytecode magic number,
+so a new interpreter version never loads stale entries.
+
+``check_syntax`` is the pre-check run in the server before a snippet is
+dispatched. It compiles through the same cache, so errors found after parsing
+(``return`` outside a function, misplaced ``nonlocal``) never reach a worker
+either.
+"""
+import hashlib
+import marshal
+import os
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+
+from runner.cache import ResultCache
+from runner.config import env_int
+
+FILENAME = "<string>"
+
+CODE_CACHE = ResultCache(
+    max_entries=env_int("RUNNER_COMPILE_CACHE_ENTRIES", 512),
+    max_bytes=env_int("RUNNER_COMPILE_CACHE_BYTES", 64 * 1024 * 1024),
+)
+
+_bytecode_dir = os.environ.get("RUNNER_BYTECODE_DIR")
+BYTECODE_DIR = Path(_bytecode_dir) / MAGIC_NUMBER.hex() if _bytecode_dir else None
+
+
+def source_key(source):
+    return hashlib.sha256(MAGIC_NUMBER + source.encode()).hexdigest()
+
+
+def _to_disk(entry):
+    if isinstance(entry, SyntaxError):
+        return ("SyntaxError", type(entry).__name__, entry.msg, entry.lineno, entry.offset, entry.text,
+                entry.end_lineno, entry.end_offset)
+    return entry
+
+
+def _from_disk(data):
+    if isinstance(data, tuple) and data and data[0] == "SyntaxError":
+        _, name, msg, lineno, offset, text, end_lineno, end_offset = data
+        error_type = {"IndentationError": IndentationError, "TabError": TabError}.get(name, SyntaxError)
+        return error_type(msg, (FILENAME, lineno, offset, text, end_lineno, end_offset))
+    return data
+
+
+def _load(key):
+    if BYTECODE_DIR is None:
+        return None
+    try:
+        return _from_disk(marshal.loads((BYTECODE_DIR / key).read_bytes()))
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+
+
+def _store(key, entry):
+    if BYTECODE_DIR is None:
+        return
+    try:
+        BYTECODE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = BYTECODE_DIR / f"{key}.{os.getpid()}.tmp"
+        tmp.write_bytes(marshal.dumps(_to_disk(entry)))
+        os.replace(tmp, BYTECODE_DIR / key)
+    except OSError:
+        pass
+
+
+def compile_snippet(source):
+    """Return the code object for ``source``, raising its cached SyntaxError if it has one"""
+    key = source_key(source)
+    entry = CODE_CACHE.get(key)
+    if entry is None:
+        entry = _load(key)
+        if entry is None:
+            try:
+                entry = compile(source, FILENAME, "exec")
+            except SyntaxError as e:
+                entry = e
+            _store(key, entry)
+        CODE_CACHE.put(key, entry)
+    if isinstance(entry, SyntaxError):
+        raise entry.with_traceback(None)
+    return entry
+
+
+def check_syntax(source):
+    """Return the SyntaxError (or IndentationError) ``source`` fails to compile with, or None"""
+    try:
+        compile_snippet(source)
+    except SyntaxError as e:
+        return e
+    except ValueError as e:  # null bytes in the source
+        return SyntaxError(str(e))
+    return None
@@ -0,0 +1,8 @@
+"""Deployment settings read from the environment"""
+import os
+
+
+def env_int(name, default):
+    """Read an integer setting, falling back to ``default`` when unset or empty"""
+    value = os.environ.get(name, "").strip()
+    return int(value) if value else default
@@ -0,0 +1,77 @@
+"""Snippet execution pipeline shared by both apps"""
+import time
+
+from runner import backends, determinism
+from runner.cache import RESULT_CACHE, snippet_key
+from runner.compiled import check_syntax
+from runner.kernel import KERNELS
+from runner.limits import DEFAULT_LIMITS, is_limit_error
+from runner.singleflight import SingleFlight
+from runner.telemetry import TELEMETRY
+from runner.worker import syntax_error_result
+
+# Concurrent cacheable requests for the same snippet share one execution
+IN_FLIGHT = SingleFlight()
+
+
+def execute(source, cache=True, limits=None, seed=None, example_id=None, session_id=None, kernel=False,
+            incremental=False):
+    """Return the result of ``source``, served from RESULT_CACHE when ``cache`` is set
+
+    Source that does not parse is answered in-process with a SyntaxError result
+    and never dispatched.
+    ``limits`` defaults to DEFAULT_LIMITS; runs that hit a limit or that the
+    backend failed to complete (a crashed worker, no free kernel) are never cached.
+    Cacheable requests that arrive while the same snippet is already running wait
+    for that run and share its result instead of starting another.
+    A ``seed`` runs the snippet in deterministic mode; if that mode is disabled
+    the snippet runs normally and, being nondeterministic, is not cached.
+    ``example_id`` and ``session_id`` tag the execution in TELEMETRY. With
+    ``kernel`` the snippet runs in the session's kernel (runner.kernel), sees
+    what earlier runs left in its namespace and is therefore never cached; it
+    ignores ``seed``, whose stand-in modules would stay bound in that namespace.
+    ``incremental`` runs re-execute only the statements affected since earlier
+    runs of similar code in the same pool worker (runner.incremental); they are
+    not cached, ignore ``seed``, and ``kernel`` takes precedence over them.
+    """
+    error = check_syntax(source)
+    if error is not None:
+        result = syntax_error_result(error)
+        TELEMETRY.record(result, example_id, session_id, source="precheck")
+        return result
+    if seed is not None and not determinism.ENABLED:
+        seed, cache = None, False
+    if kernel:
+        seed = None
+    if kernel or incremental:
+        cache = False
+    limits = limits or DEFAULT_LIMITS
+    key = snippet_key(source, seed)
+
+    def run():
+        if cache:
+            # The previous leader may have finished between our cache miss and now
+            cached = RESULT_CACHE.get(key)
+            if cached is not None:
+                TELEMETRY.record(cached, example_id, session_id, source="cache")
+                return cached
+        submitted_at = time.time()
+        if kernel:
+            result = KERNELS.run(session_id, source, limits)
+        else:
+            result = backends.get_backend().run(source, limits, seed, incremental)
+        TELEMETRY.record(result, example_id, session_id, submitted_at=submitted_at)
+        if cache and not is_limit_error(result) and not backends.is_backend_error(result):
+            RESULT_CACHE.put(key, result)
+        return result
+
+    if not cache:
+        return run()
+    cached = RESULT_CACHE.get(key)
+    if cached is not None:
+        TELEMETRY.record(cached, example_id, session_id, source="cache")
+        return cached
+    result, shared = IN_FLIGHT.do((key, limits), run)
+    if shared:
+        TELEMETRY.record(result, example_id, session_id, source="coalesced")
+    return result
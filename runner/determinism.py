@@ -0,0 +1,105 @@
+"""Deterministic execution: seeded random numbers and a frozen clock
+
+A seeded run gets its own ``__builtins__`` whose ``__import__`` hands the
+snippet stand-ins for ``random``, ``time`` and ``datetime``: the random
+functions are bound to a ``random.Random(seed)`` private to the run and the
+clocks report ``RUNNER_FROZEN_TIME`` (ISO format, treated as UTC). Nothing is
+patched process-wide, so concurrent runs do not interfere. NumPy's legacy
+global generator is seeded the first time the run imports numpy; that state
+is shared by the process, so only runs on pool workers (one run at a time) are
+guaranteed to be reproducible. ``RUNNER_DETERMINISTIC=0`` disables the mode.
+"""
+import builtins
+import datetime
+import os
+import random
+import sys
+import time
+import types
+
+from runner.config import env_int
+
+ENABLED = env_int("RUNNER_DETERMINISTIC", 1) != 0
+FROZEN_TIME = datetime.datetime.fromisoformat(os.environ.get("RUNNER_FROZEN_TIME", "2024-01-15T10:30:00"))
+
+
+def _module_copy(module):
+    copy = types.ModuleType(module.__name__, module.__doc__)
+    copy.__dict__.update((name, value) for name, value in vars(module).items() if not name.startswith("__"))
+    return copy
+
+
+def _random_module(seed):
+    rng = random.Random(seed)
+    module = _module_copy(random)
+    for name, value in vars(random).items():
+        if getattr(value, "__self__", None) is random._inst:
+            setattr(module, name, getattr(rng, name))
+    return module
+
+
+def _datetime_module(frozen):
+    utc = frozen.replace(tzinfo=datetime.timezone.utc)
+
+    class FrozenDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            moment = utc.astimezone(tz) if tz is not None else frozen
+            return cls.combine(moment.date(), moment.timetz())
+
+        @classmethod
+        def today(cls):
+            return cls.now()
+
+        @classmethod
+        def utcnow(cls):
+            return cls.now()
+
+    class FrozenDate(datetime.date):
+        @classmethod
+        def today(cls):
+            return cls(frozen.year, frozen.month, frozen.day)
+
+    FrozenDatetime.__name__ = FrozenDatetime.__qualname__ = "datetime"
+    FrozenDate.__name__ = FrozenDate.__qualname__ = "date"
+    module = _module_copy(datetime)
+    module.datetime = FrozenDatetime
+    module.date = FrozenDate
+    return module
+
+
+def _time_module(frozen):
+    timestamp = frozen.replace(tzinfo=datetime.timezone.utc).timestamp()
+    module = _module_copy(time)
+    module.time = lambda: timestamp
+    module.time_ns = lambda: int(timestamp * 1_000_000_000)
+    module.gmtime = lambda secs=None: time.gmtime(timestamp if secs is None else secs)
+    module.localtime = module.gmtime
+    module.ctime = lambda secs=None: time.asctime(module.gmtime(secs))
+    module.asctime = lambda t=None: time.asctime(module.gmtime() if t is None else t)
+    module.strftime = lambda format, t=None: time.strftime(format, module.gmtime() if t is None else t)
+    return module
+
+
+def seeded_builtins(seed, frozen=FROZEN_TIME):
+    """A ``__builtins__`` mapping that makes the run see seeded RNGs and a frozen clock"""
+    stand_ins = {
+        "random": _random_module(seed),
+        "datetime": _datetime_module(frozen),
+        "time": _time_module(frozen),
+    }
+    numpy_seeded = False
+
+    def _import(name, globals=None, locals=None, fromlist=(), level=0):
+        nonlocal numpy_seeded
+        module = builtins.__import__(name, globals, locals, fromlist, level)
+        if level:
+            return module
+        if name.partition(".")[0] == "numpy" and not numpy_seeded:
+            sys.modules["numpy"].random.seed(seed % 2 ** 32)
+            numpy_seeded = True
+        return stand_ins.get(name, module)
+
+    namespace = dict(vars(builtins))
+    namespace["__import__"] = _import
+    return namespace
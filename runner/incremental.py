@@ -0,0 +1,365 @@
+"""Incremental re-execution of edited snippets
+
+A snippet is split into its top-level statements, and each statement is
+analysed statically for the names it reads and writes. A statement's key hashes
+its AST, how many identical statements precede it, and the keys of the
+statements that last wrote the names it reads or writes. After a statement runs,
+its output and a deep copy of the names it wrote are cached under that key. When an edited version of the snippet runs, a
+statement whose key is unchanged replays its cached output and effects instead
+of executing. Only the edited statements and the statements downstream of them
+actually run.
+
+Writes include plain bindings, ``del``, item and attribute assignment
+(``df['x'] = ...``), calls with ``inplace=True`` or of common mutating methods
+(``append``, ``update``, ``sort``, ``send``, ...), the iterator passed to ``next``
+or ``iter``, every imported module or function called (modules keep state between
+calls: ``pd.set_option``, a generator advanced by ``random.random()``), and every
+name involved in a call whose result is discarded (``np.random.shuffle(a)``).
+Mutation hidden anywhere else is not seen. A name bound from other computed names (``b = a``, ``b = [a]``,
+``for v in a``) may share objects with them, so writing any name of such an
+alias group writes the whole group. Statements that define functions, classes or lambdas always run again,
+because those objects close over the namespace of the run that created them.
+Statements that draw random numbers or read the clock through the modules in
+``FRESH_CALLS`` always run too, since replaying them would skip the state they
+advance, and so does every statement that reads what they produced in the run.
+Snippets that use ``global``, star imports or ``globals()``/``exec``-style
+introspection are executed in full.
+"""
+import ast
+import copy
+import hashlib
+import io
+import time
+import types
+from dataclasses import dataclass
+
+from runner.cache import ResultCache, snippet_key
+from runner.capture import HEAD_BYTES, TAIL_BYTES, BoundedCapture, capture
+from runner.compiled import FILENAME
+from runner.config import env_int
+from runner.limits import LimitExceeded, enforce
+from runner.worker import ExecutionResult, failure_result, measure_peak_rss, run_snippet
+
+MUTATING_METHODS = frozenset({
+    "append", "extend", "insert", "pop", "remove", "clear", "update", "sort", "reverse",
+    "add", "discard", "setdefault", "popitem", "fill", "resize", "seed", "shuffle",
+    "send", "throw", "close", "__next__",
+})
+OPAQUE_CALLS = frozenset({"globals", "locals", "vars", "exec", "eval", "__import__"})
+# Builtins that advance the iterator they are given
+ITERATOR_CALLS = frozenset({"next", "iter"})
+# Functions under these paths give a different result on every call
+FRESH_CALLS = (
+    "random", "numpy.random", "secrets", "uuid", "os.urandom", "time",
+    "datetime.datetime.now", "datetime.datetime.today", "datetime.datetime.utcnow", "datetime.date.today",
+)
+
+# Statement output longer than this is not worth replaying from memory
+MAX_CACHED_OUTPUT = HEAD_BYTES + TAIL_BYTES
+
+_DELETED = object()
+
+SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+
+
+@dataclass
+class Statement:
+    """A top-level statement with its compiled code and static dependencies"""
+    code: types.CodeType
+    key: str
+    reads: frozenset
+    writes: frozenset
+    deletes: frozenset
+    volatile: bool
+    fresh: bool
+
+
+class _Opaque(Exception):
+    pass
+
+
+def _root(node):
+    while isinstance(node, (ast.Attribute, ast.Subscript, ast.Starred)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def _path(node):
+    """Dotted name of a ``a.b.c`` expression as a list, or None"""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    return [node.id, *reversed(parts)]
+
+
+def _is_fresh(path):
+    return any(path == prefix or path.startswith(prefix + ".") for prefix in FRESH_CALLS)
+
+
+def _imports(stmt):
+    """Names ``stmt`` binds by importing, mapped to the module path they stand for"""
+    names = {}
+    for node, nested in _walk(stmt):
+        if nested:
+            continue
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    names[alias.asname] = alias.name
+                else:
+                    names[alias.name.partition(".")[0]] = alias.name.partition(".")[0]
+        elif isinstance(node, ast.ImportFrom) and not node.level:
+            for alias in node.names:
+                names[alias.asname or alias.name] = f"{node.module}.{alias.name}"
+    return names
+
+
+def _walk(node, nested=False):
+    """Every node under ``node`` with whether it lies in a function, lambda or class body"""
+    yield node, nested
+    nested = nested or isinstance(node, SCOPES)
+    for child in ast.iter_child_nodes(node):
+        yield from _walk(child, nested)
+
+
+def _analyse(stmt, imported):
+    """Names ``stmt`` reads, binds, defines (imports, functions, classes), mutates and deletes
+
+    ``imported`` maps the names bound by imports to their module paths.
+    """
+    reads, binds, defines, mutates, deletes = set(), set(), set(), set(), set()
+    volatile = fresh = False
+    for node, nested in _walk(stmt):
+        if isinstance(node, ast.Name):
+            if isinstance(node.ctx, ast.Load):
+                reads.add(node.id)
+            elif not nested:  # names stored in a body are its locals
+                binds.add(node.id)
+                if isinstance(node.ctx, ast.Del):
+                    deletes.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if not nested:
+                defines.add(node.name)
+            volatile = True
+        elif isinstance(node, ast.Lambda):
+            volatile = True
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    raise _Opaque
+                if not nested:
+                    defines.add(alias.asname or alias.name.partition(".")[0])
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            raise _Opaque
+        elif isinstance(node, ast.AugAssign) and _root(node.target) and not (
+                nested and isinstance(node.target, ast.Name)):
+            reads.add(_root(node.target))
+            mutates.add(_root(node.target))
+        elif isinstance(node, (ast.Attribute, ast.Subscript)) and not isinstance(node.ctx, ast.Load):
+            if _root(node):
+                mutates.add(_root(node))
+        elif isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id in OPAQUE_CALLS:
+                raise _Opaque
+            path = _path(func)
+            if path and path[0] in imported:
+                mutates.add(path[0])
+                fresh = fresh or _is_fresh(".".join([imported[path[0]], *path[1:]]))
+            elif isinstance(func, ast.Name) and func.id in ITERATOR_CALLS and node.args and _root(node.args[0]):
+                mutates.add(_root(node.args[0]))
+            if isinstance(func, ast.Attribute) and _root(func.value) and (
+                    func.attr in MUTATING_METHODS or any(k.arg == "inplace" for k in node.keywords)):
+                mutates.add(_root(func.value))
+    # A call whose result is thrown away is made for its side effects
+    if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
+        call = stmt.value
+        if not (isinstance(call.func, ast.Name) and call.func.id == "print"):
+            for node in [call.func, *call.args, *(k.value for k in call.keywords)]:
+                if _root(node):
+                    mutates.add(_root(node))
+    return reads, binds, defines, mutates, deletes, volatile, fresh
+
+
+def plan(source):
+    """Split ``source`` into Statements, or return None when it must run in full"""
+    cached = PLAN_CACHE.get(snippet_key(source))
+    if cached is not None:
+        return cached or None
+    try:
+        tree = ast.parse(source, FILENAME)
+        statements = []
+        last_writer = {}
+        # What calling a function or class defined by the snippet may read and mutate, and
+        # whether it draws random numbers or reads the clock
+        callables = {}
+        imported = {}
+        # How often each statement's AST occurred before, so that repeats get keys of their own
+        occurrences = {}
+        # Names bound to values the snippet computed, and for each the names that may share objects with it
+        variables, aliases = set(), {}
+        for stmt in tree.body:
+            imports = _imports(stmt)
+            reads, binds, defines, mutates, deletes, volatile, fresh = _analyse(stmt, {**imported, **imports})
+            for name in reads & callables.keys():
+                reads |= callables[name][0]
+                mutates |= callables[name][1]
+                fresh = fresh or callables[name][2]
+            if volatile:
+                callables.update((name, (reads, mutates, fresh)) for name in binds | defines)
+            for name in binds | defines:
+                imported.pop(name, None)
+            imported.update(imports)
+            # A bound value may be, or contain, any computed value the statement read (b = a, b = [a])
+            if binds:
+                group = set()
+                for name in binds | (reads & variables):
+                    group |= aliases.get(name, {name})
+                for name in group:
+                    aliases[name] = group
+            variables = (variables - defines) | binds
+            # Mutating or rebinding a name can change what every alias of it shows, so all of
+            # them count as written: their readers re-run and are replayed with them
+            writes = set(defines)
+            for name in binds | mutates:
+                writes |= aliases.get(name, {name})
+            reads, writes, deletes = frozenset(reads), frozenset(writes), frozenset(deletes)
+            tree_digest = hashlib.sha256(ast.dump(stmt).encode()).hexdigest()
+            occurrence = occurrences.get(tree_digest, 0)
+            occurrences[tree_digest] = occurrence + 1
+            digest = hashlib.sha256(f"{tree_digest}\0{occurrence}".encode())
+            # The cached effects hold every written name, so their prior versions belong in the key too
+            for name in sorted(reads | writes):
+                digest.update(f"\0{name}={last_writer.get(name, '')}".encode())
+            key = digest.hexdigest()
+            for name in writes:
+                last_writer[name] = key
+            code = compile(ast.Module([stmt], type_ignores=[]), FILENAME, "exec", dont_inherit=True)
+            statements.append(Statement(code, key, reads, writes, deletes, volatile, fresh))
+    except (SyntaxError, ValueError, _Opaque):
+        statements = []
+    PLAN_CACHE.put(snippet_key(source), statements)
+    return statements or None
+
+
+def _snapshot(namespace, statement):
+    effects = {name: namespace[name] for name in statement.writes if name in namespace}
+    modules = {name: value for name, value in effects.items() if isinstance(value, types.ModuleType)}
+    rest = {name: value for name, value in effects.items() if name not in modules}
+    deleted = {name: _DELETED for name in statement.deletes if name not in namespace}
+    # One deepcopy for all of them keeps aliasing between the names intact
+    copies = copy.deepcopy(rest)
+    if any(type(copies[name]) is not type(value) for name, value in rest.items()):
+        # Some objects copy as something else (a dict iterator becomes a list iterator)
+        raise TypeError("effects do not survive copying")
+    return {**modules, **copies, **deleted}
+
+
+class _Tee(io.TextIOBase):
+    """Forwards writes to the run's capture while keeping a copy for one statement"""
+
+    def __init__(self, target):
+        self.target = target
+        self.parts = []
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        self.target.write(s)
+        if self.size <= MAX_CACHED_OUTPUT:
+            self.parts.append(s)
+            self.size += len(s)
+        return len(s)
+
+
+def _execute(statements, namespace, output, metrics):
+    # Names whose values are the cached objects themselves; copied before anything executes
+    borrowed = set()
+    # Names holding what fresh statements, or statements reading their results, computed in this run
+    drawn = set()
+    for statement in statements:
+        forced = statement.fresh or not statement.reads.isdisjoint(drawn)
+        entry = None if statement.volatile or forced else STATEMENT_CACHE.get(statement.key)
+        if entry is not None:
+            text, effects = entry
+            output.write(text)
+            for name, value in effects.items():
+                if value is _DELETED:
+                    namespace.pop(name, None)
+                    borrowed.discard(name)
+                else:
+                    namespace[name] = value
+                    if not isinstance(value, types.ModuleType):
+                        borrowed.add(name)
+                    else:
+                        borrowed.discard(name)
+            continue
+        if borrowed:
+            # Code may reach a cached object through names it does not mention (aliases,
+            # closures), so copy every borrowed value, in one go to keep aliasing between them
+            namespace.update(copy.deepcopy({name: namespace[name] for name in borrowed}))
+            borrowed.clear()
+        tee = _Tee(output)
+        with capture(tee):
+            exec(statement.code, namespace)
+        metrics["statements_run"] += 1
+        if forced:
+            # Modules carry on as they are; values computed from this run's draws may differ from cached ones
+            drawn.update(
+                name for name in statement.writes if not isinstance(namespace.get(name), types.ModuleType))
+        if statement.volatile or forced or tee.size > MAX_CACHED_OUTPUT:
+            continue
+        try:
+            STATEMENT_CACHE.put(statement.key, ("".join(tee.parts), _snapshot(namespace, statement)))
+        except Exception:
+            pass  # effects that cannot be copied are simply recomputed next time
+
+
+def run_incremental(source, limits=None):
+    """Execute ``source`` like run_snippet, reusing statements unchanged since earlier runs
+
+    The metrics additionally record how many top-level ``statements`` the
+    snippet has and how many of them were executed (``statements_run``).
+    """
+    statements = plan(source)
+    if statements is None:
+        return run_snippet(source, limits)
+    metrics = {"started_at": time.time(), "statements": len(statements), "statements_run": 0}
+    namespace = {"__name__": "__main__"}
+    output = BoundedCapture(max_bytes=limits.output_bytes if limits else None)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        with measure_peak_rss(metrics), capture(output):
+            if limits is None:
+                _execute(statements, namespace, output, metrics)
+            else:
+                with enforce(limits):
+                    _execute(statements, namespace, output, metrics)
+        result = ExecutionResult(output.getvalue())
+    except (Exception, LimitExceeded, SystemExit) as e:
+        result = failure_result(output.getvalue(), e)
+    finally:
+        output.close()
+        # Not torn down like run_snippet's: the statement cache deliberately keeps these objects
+        namespace.clear()
+    metrics["exec_seconds"] = time.perf_counter() - wall
+    metrics["exec_cpu_seconds"] = time.process_time() - cpu
+    metrics["output_bytes"] = output.written
+    result.metrics = metrics
+    result.truncated_bytes = output.dropped
+    result.full_output = output.spill_path
+    return result
+
+
+# Both live in the process that executes, normally a pool worker, and serve every session
+# whose runs land there: keys depend only on the code, never on who ran it
+PLAN_CACHE = ResultCache(max_entries=env_int("RUNNER_INCREMENTAL_PLANS", 64), max_bytes=64 * 1024 * 1024)
+STATEMENT_CACHE = ResultCache(
+    max_entries=env_int("RUNNER_INCREMENTAL_ENTRIES", 512),
+    max_bytes=env_int("RUNNER_INCREMENTAL_BYTES", 256 * 1024 * 1024),
+)
@@ -0,0 +1,160 @@
+"""Session kernels: per-session worker processes whose namespace survives between runs
+
+In kernel mode a session's snippets all run in one dedicated process, so the
+objects an example builds (imports, DataFrames) stay available to the next
+snippet instead of being rebuilt. Each kernel's address space is capped at
+``RUNNER_KERNEL_MEMORY_BYTES`` on top of its start-up size for its whole life,
+not per run. At most ``RUNNER_KERNELS`` kernels are kept; the least recently
+used idle one is shut down to make room, and kernels idle for longer than
+``RUNNER_KERNEL_IDLE_SECONDS`` are reaped. A run that times out or crashes
+shuts the kernel down, so the session's next run starts with an empty namespace.
+A run that hits the memory cap fails with ``MemoryLimitExceeded`` but keeps the
+kernel and its namespace; resetting the session frees the memory.
+"""
+import threading
+import time
+import types
+from dataclasses import replace
+
+from runner.backends import CONTEXT, HARD_TIMEOUT_GRACE, backend_error, preload_modules
+from runner.config import env_int
+from runner.limits import mapped_bytes
+from runner.worker import run_snippet
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _namespace_summary(namespace):
+    return {name: type(value).__name__ for name, value in namespace.items()
+            if not name.startswith("_") and not isinstance(value, types.ModuleType)}
+
+
+def _serve(conn, memory_bytes):
+    preload_modules()
+    if memory_bytes and resource is not None:
+        hard = resource.getrlimit(resource.RLIMIT_AS)[1]
+        resource.setrlimit(resource.RLIMIT_AS, (mapped_bytes() + memory_bytes, hard))
+    namespace = {"__name__": "__main__"}
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        source, limits = request
+        result = run_snippet(source, replace(limits, memory_bytes=None), globals_=namespace)
+        if result.error_type == "MemoryError":
+            result.error_type = "MemoryLimitExceeded"
+            result.error_message = f"session memory cap of {memory_bytes} bytes exceeded; reset the session to free memory"
+            result.traceback = f"{result.error_type}: {result.error_message}\n"
+        result.namespace = _namespace_summary(namespace)
+        conn.send(result)
+
+
+class Kernel:
+    """One session's worker process and the pipe to it"""
+
+    def __init__(self, memory_bytes):
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self._conn, child = CONTEXT.Pipe()
+        self._process = CONTEXT.Process(target=_serve, args=(child, memory_bytes), name="runner-kernel", daemon=True)
+        self._process.start()
+        child.close()
+
+    @property
+    def alive(self):
+        return self._process.is_alive()
+
+    def run(self, source, limits):
+        """Execute ``source`` in the kernel; a timeout or crash shuts the kernel down"""
+        self.last_used = time.monotonic()
+        timeout = limits.wall_seconds + HARD_TIMEOUT_GRACE if limits.wall_seconds else None
+        try:
+            self._conn.send((source, limits))
+            if self._conn.poll(timeout):
+                return self._conn.recv()
+            result = backend_error("TimeLimitExceeded",
+                                   f"wall-clock limit of {limits.wall_seconds} s exceeded; the session was reset")
+        except (EOFError, OSError):
+            result = backend_error("WorkerCrashed", "the session kernel exited unexpectedly; the session was reset")
+        self.shutdown()
+        return result
+
+    def shutdown(self):
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._conn.close()
+        self._process.join(timeout=1)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+
+
+class KernelManager:
+    """Thread-safe map of session id to Kernel with a size cap and idle reaping"""
+
+    def __init__(self, max_kernels=4, idle_seconds=900, memory_bytes=2 * 1024 * 1024 * 1024):
+        self.max_kernels = max_kernels
+        self.idle_seconds = idle_seconds
+        self.memory_bytes = memory_bytes
+        self._lock = threading.Lock()
+        self._kernels = {}
+
+    def _evict(self, session_id):
+        kernel = self._kernels.pop(session_id, None)
+        if kernel is not None:
+            threading.Thread(target=kernel.shutdown, daemon=True).start()
+
+    def _acquire(self, session_id):
+        with self._lock:
+            now = time.monotonic()
+            for sid, kernel in list(self._kernels.items()):
+                if now - kernel.last_used > self.idle_seconds and not kernel.lock.locked():
+                    self._evict(sid)
+            kernel = self._kernels.get(session_id)
+            if kernel is not None and kernel.alive:
+                return kernel
+            self._evict(session_id)
+            idle = sorted((k.last_used, sid) for sid, k in self._kernels.items() if not k.lock.locked())
+            while idle and len(self._kernels) >= self.max_kernels:
+                self._evict(idle.pop(0)[1])
+            if len(self._kernels) >= self.max_kernels:
+                return None
+            kernel = self._kernels[session_id] = Kernel(self.memory_bytes)
+            return kernel
+
+    def run(self, session_id, source, limits):
+        """Run ``source`` in the session's kernel, starting one if needed"""
+        kernel = self._acquire(session_id)
+        if kernel is None:
+            return backend_error("KernelsBusy", f"all {self.max_kernels} session kernels are busy; try again shortly")
+        with kernel.lock:
+            return kernel.run(source, limits)
+
+    def reset(self, session_id):
+        """Discard the session's namespace by shutting down its kernel"""
+        with self._lock:
+            self._evict(session_id)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._kernels)
+
+    def shutdown(self):
+        with self._lock:
+            for session_id in list(self._kernels):
+                self._evict(session_id)
+
+
+KERNELS = KernelManager(
+    max_kernels=env_int("RUNNER_KERNELS", 4),
+    idle_seconds=env_int("RUNNER_KERNEL_IDLE_SECONDS", 900),
+    memory_bytes=env_int("RUNNER_KERNEL_MEMORY_BYTES", 2 * 1024 * 1024 * 1024),
+)
@@ -0,0 +1,132 @@
+"""Per-execution resource limits
+
+Limits are enforced inside the process that runs the snippet: an interval timer
+for wall time, ``RLIMIT_CPU`` for CPU seconds and ``RLIMIT_AS`` for the memory a
+run may add on top of what the process already maps. Each is raised as a
+``LimitExceeded`` subclass, which derives from BaseException so a snippet's own
+``except Exception`` cannot swallow it. Process-wide limits are only applied in
+pool workers; the in-process backend enforces just the output budget.
+"""
+import math
+import os
+import signal
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+
+from runner.config import env_int
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class LimitExceeded(BaseException):
+    """Raised inside a snippet when one of its resource limits is crossed"""
+
+
+class TimeLimitExceeded(LimitExceeded):
+    pass
+
+
+class CPULimitExceeded(LimitExceeded):
+    pass
+
+
+class MemoryLimitExceeded(LimitExceeded):
+    pass
+
+
+class OutputLimitExceeded(LimitExceeded):
+    pass
+
+
+LIMIT_ERRORS = {cls.__name__ for cls in (TimeLimitExceeded, CPULimitExceeded, MemoryLimitExceeded, OutputLimitExceeded)}
+
+
+@dataclass(frozen=True)
+class Limits:
+    """Bounds for one execution; None or 0 disables a limit"""
+    wall_seconds: float = 10
+    cpu_seconds: float = 10
+    memory_bytes: int = 1024 * 1024 * 1024
+    output_bytes: int = 16 * 1024 * 1024
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            wall_seconds=env_int("RUNNER_WALL_SECONDS", cls.wall_seconds),
+            cpu_seconds=env_int("RUNNER_CPU_SECONDS", cls.cpu_seconds),
+            memory_bytes=env_int("RUNNER_MEMORY_BYTES", cls.memory_bytes),
+            output_bytes=env_int("RUNNER_OUTPUT_BYTES", cls.output_bytes),
+        )
+
+    def output_only(self):
+        """Copy keeping only the output budget, for runs that share the server process"""
+        return replace(self, wall_seconds=None, cpu_seconds=None, memory_bytes=None)
+
+
+DEFAULT_LIMITS = Limits.from_env()
+
+
+def is_limit_error(result):
+    return result.error_type in LIMIT_ERRORS
+
+
+def mapped_bytes():
+    """Address space currently mapped by this process, or 0 where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _raise(exc_type, message):
+    def handler(signum, frame):
+        raise exc_type(message)
+    return handler
+
+
+@contextmanager
+def enforce(limits):
+    """Apply the wall, CPU and memory limits of ``limits`` to the current process"""
+    # Undone in reverse, so the wall-clock timer is armed last and cancelled first
+    restore = []
+    try:
+        if limits.cpu_seconds and resource is not None:
+            message = f"CPU time limit of {limits.cpu_seconds} s exceeded"
+            previous_handler = signal.signal(signal.SIGXCPU, _raise(CPULimitExceeded, message))
+            soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+            budget = math.ceil(_cpu_time() + limits.cpu_seconds)
+            if hard != resource.RLIM_INFINITY:
+                budget = min(budget, hard)
+            resource.setrlimit(resource.RLIMIT_CPU, (budget, hard))
+            restore.append(lambda: (resource.setrlimit(resource.RLIMIT_CPU, (soft, hard)),
+                                    signal.signal(signal.SIGXCPU, previous_handler)))
+        if limits.memory_bytes and resource is not None:
+            soft_as, hard_as = resource.getrlimit(resource.RLIMIT_AS)
+            budget = mapped_bytes() + limits.memory_bytes
+            if hard_as != resource.RLIM_INFINITY:
+                budget = min(budget, hard_as)
+            resource.setrlimit(resource.RLIMIT_AS, (budget, hard_as))
+            restore.append(lambda: resource.setrlimit(resource.RLIMIT_AS, (soft_as, hard_as)))
+        if limits.wall_seconds and hasattr(signal, "setitimer"):
+            message = f"wall-clock limit of {limits.wall_seconds} s exceeded"
+            previous = signal.signal(signal.SIGALRM, _raise(TimeLimitExceeded, message))
+            signal.setitimer(signal.ITIMER_REAL, limits.wall_seconds)
+            restore.append(lambda: (signal.setitimer(signal.ITIMER_REAL, 0), signal.signal(signal.SIGALRM, previous)))
+        try:
+            yield
+        except MemoryError:
+            if not limits.memory_bytes:
+                raise
+            raise MemoryLimitExceeded(f"memory limit of {limits.memory_bytes} bytes exceeded") from None
+    finally:
+        for undo in reversed(restore):
+            undo()
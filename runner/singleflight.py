@@ -0,0 +1,53 @@
+"""Single-flight deduplication of concurrent identical executions
+
+When many sessions click the same button at once, every request misses the
+result cache before the first run has finished. ``SingleFlight`` lets the first
+caller for a key execute while later callers for the same key wait for it and
+share its result.
+"""
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Return ``(fn(), shared)``; ``shared`` is True when another caller's run was reused
+
+        Exceptions raised by ``fn`` propagate to every caller waiting on it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, False
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,218 @@
+"""In-process execution telemetry in Prometheus text format
+
+Every call to ``execute`` is recorded with its example id and session. Counters
+and histograms are aggregated per example; the session only appears in the
+bounded ``recent()`` log, keeping the exported label set small, and in a count of
+the sessions active within the last ``session_window`` seconds. The process pool
+reports every replacement worker it starts, by reason. Expose the
+metrics by setting ``RUNNER_METRICS_FILE`` (rewritten every
+``RUNNER_METRICS_INTERVAL`` seconds) and/or ``RUNNER_METRICS_PORT`` (a plain HTTP
+endpoint serving ``/metrics`` on localhost) for a local scraper.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from runner.config import env_int
+from runner.limits import LIMIT_ERRORS
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# (metric name, key in ExecutionResult.metrics, help text)
+SUMMARIES = (
+    ("runner_queue_wait_seconds", "queue_wait_seconds", "Time between submission and the start of execution."),
+    ("runner_compile_seconds", "compile_seconds", "Wall time spent compiling snippets."),
+    ("runner_exec_cpu_seconds", "exec_cpu_seconds", "CPU time spent executing snippets."),
+    ("runner_output_bytes", "output_bytes", "Bytes of captured output."),
+    ("runner_leaked_objects", "leaked_objects", "Objects bound by snippets that outlived their torn-down namespace."),
+)
+
+
+def outcome(result):
+    if result.ok:
+        return "ok"
+    return "limit" if result.error_type in LIMIT_ERRORS else "error"
+
+
+class _ExampleStats:
+    def __init__(self):
+        self.executions = {}
+        self.sums = {key: 0.0 for _, key, _ in SUMMARIES}
+        self.measured = 0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.latency_sum = 0.0
+        self.peak_rss_bytes = 0
+
+
+class Telemetry:
+    """Thread-safe aggregation of execution measurements"""
+
+    def __init__(self, recent=1000, session_window=900):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.session_window = session_window
+        self._sessions = OrderedDict()  # session id -> last seen, least recent first
+        self._sessions_seen = 0
+        self._worker_replacements = {}
+        self._recent = deque(maxlen=recent)
+
+    def _active_sessions(self, now):
+        while self._sessions and next(iter(self._sessions.values())) < now - self.session_window:
+            self._sessions.popitem(last=False)
+        return len(self._sessions)
+
+    def record(self, result, example_id=None, session_id=None, source="run", submitted_at=None):
+        """Account for one execution
+
+        ``source`` says where the result came from: "run", or one of the ways
+        that only count because nothing ran: "cache", "coalesced" (shared from a
+        concurrent identical run) and "precheck" (rejected by the syntax check).
+        """
+        example = example_id or "adhoc"
+        metrics = dict(result.metrics or {}) if source == "run" else {}
+        if metrics and submitted_at is not None:
+            metrics["queue_wait_seconds"] = max(0.0, metrics["started_at"] - submitted_at)
+        with self._lock:
+            stats = self._stats.setdefault(example, _ExampleStats())
+            counter = (source, outcome(result))
+            stats.executions[counter] = stats.executions.get(counter, 0) + 1
+            if metrics:
+                stats.measured += 1
+                for _, key, _ in SUMMARIES:
+                    stats.sums[key] += metrics.get(key, 0.0)
+                latency = metrics.get("exec_seconds", 0.0)
+                stats.latency_sum += latency
+                for i, bound in enumerate(LATENCY_BUCKETS):
+                    if latency <= bound:
+                        stats.buckets[i] += 1
+                stats.peak_rss_bytes = max(stats.peak_rss_bytes, metrics.get("peak_rss_bytes", 0))
+            if session_id is not None:
+                if session_id not in self._sessions:
+                    self._sessions_seen += 1
+                self._sessions[session_id] = time.monotonic()
+                self._sessions.move_to_end(session_id)
+                self._active_sessions(time.monotonic())
+            self._recent.append({
+                "time": time.time(),
+                "example": example,
+                "session": session_id,
+                "source": source,
+                "outcome": counter[1],
+                **metrics,
+            })
+
+    def record_worker_replacement(self, reason):
+        """Account for a pool worker started in place of one that was recycled, crashed or timed out"""
+        with self._lock:
+            self._worker_replacements[reason] = self._worker_replacements.get(reason, 0) + 1
+
+    def recent(self):
+        """The latest recorded executions, newest last, including their session ids"""
+        with self._lock:
+            return list(self._recent)
+
+    def prometheus(self):
+        """Render the aggregated metrics in the Prometheus text exposition format"""
+        with self._lock:
+            lines = [
+                "# HELP runner_executions_total Snippet executions by example, source (run, cache, coalesced, precheck) and outcome.",
+                "# TYPE runner_executions_total counter",
+            ]
+            for example, stats in sorted(self._stats.items()):
+                for (source, result), count in sorted(stats.executions.items()):
+                    lines.append(
+                        f'runner_executions_total{{example="{example}",source="{source}",outcome="{result}"}} {count}'
+                    )
+            lines += [
+                "# HELP runner_exec_seconds Wall time spent executing snippets.",
+                "# TYPE runner_exec_seconds histogram",
+            ]
+            for example, stats in sorted(self._stats.items()):
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    lines.append(f'runner_exec_seconds_bucket{{example="{example}",le="{bound}"}} {count}')
+                lines.append(f'runner_exec_seconds_bucket{{example="{example}",le="+Inf"}} {stats.measured}')
+                lines.append(f'runner_exec_seconds_sum{{example="{example}"}} {stats.latency_sum}')
+                lines.append(f'runner_exec_seconds_count{{example="{example}"}} {stats.measured}')
+            for name, key, help_text in SUMMARIES:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+                for example, stats in sorted(self._stats.items()):
+                    lines.append(f'{name}_sum{{example="{example}"}} {stats.sums[key]}')
+                    lines.append(f'{name}_count{{example="{example}"}} {stats.measured}')
+            lines += [
+                "# HELP runner_peak_rss_bytes Highest RSS reached while running the example.",
+                "# TYPE runner_peak_rss_bytes gauge",
+            ]
+            for example, stats in sorted(self._stats.items()):
+                lines.append(f'runner_peak_rss_bytes{{example="{example}"}} {stats.peak_rss_bytes}')
+            lines += [
+                f"# HELP runner_sessions Sessions that executed snippets in the last {self.session_window} s.",
+                "# TYPE runner_sessions gauge",
+                f"runner_sessions {self._active_sessions(time.monotonic())}",
+                "# HELP runner_sessions_seen_total Session activations: first executions and returns after idling.",
+                "# TYPE runner_sessions_seen_total counter",
+                f"runner_sessions_seen_total {self._sessions_seen}",
+                "# HELP runner_worker_replacements_total Pool workers started to replace another, by reason "
+                "(recycled, crashed, timeout, startup).",
+                "# TYPE runner_worker_replacements_total counter",
+            ]
+            for reason, count in sorted(self._worker_replacements.items()):
+                lines.append(f'runner_worker_replacements_total{{reason="{reason}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+TELEMETRY = Telemetry()
+
+
+def _write_periodically(path, interval):
+    while True:
+        tmp = f"{path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(TELEMETRY.prometheus())
+            os.replace(tmp, path)
+        except OSError:
+            pass
+        time.sleep(interval)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = TELEMETRY.prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_exporters_started = False
+_exporters_lock = threading.Lock()
+
+
+def start_exporters():
+    """Start the configured file and HTTP exporters, once per process"""
+    global _exporters_started
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+    path = os.environ.get("RUNNER_METRICS_FILE")
+    if path:
+        interval = env_int("RUNNER_METRICS_INTERVAL", 15)
+        threading.Thread(target=_write_periodically, args=(path, interval), name="runner-metrics-file",
+                         daemon=True).start()
+    port = env_int("RUNNER_METRICS_PORT", 0)
+    if port:
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsHandler)
+        except OSError:
+            return  # another server process on this host already exports on the port
+        threading.Thread(target=server.serve_forever, name="runner-metrics-http", daemon=True).start()
@@ -0,0 +1,208 @@
+"""Code that runs a single snippet; executed in-process or inside pool workers
+
+Unless the caller supplies one, each run gets a fresh namespace holding only
+``__name__`` and ``__builtins__``. Afterwards the namespace is cleared, a
+garbage collection breaks the reference cycles the snippet left behind
+(``RUNNER_GC_AFTER_RUN=0`` skips it), and any object the snippet bound that is
+still alive is reported as leaked in the run's metrics. Imported modules,
+classes and functions are not counted: they live on in their modules.
+"""
+import builtins
+import gc
+import sys
+import time
+import traceback
+import types
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from runner.capture import BoundedCapture, capture
+from runner.compiled import compile_snippet
+from runner.config import env_int
+from runner.determinism import seeded_builtins
+from runner.limits import LimitExceeded, enforce
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+GC_AFTER_RUN = env_int("RUNNER_GC_AFTER_RUN", 1) != 0
+
+
+@dataclass
+class ExecutionResult:
+    """Captured stdout of a snippet and, if it raised, the exception details
+
+    ``metrics`` holds the measurements of the run that produced the result;
+    see run_snippet for the keys. When output was too long, ``output`` keeps
+    its head and tail, ``truncated_bytes`` counts what was omitted and
+    ``full_output`` names a file holding all of it, if one was kept. Runs in a
+    session kernel set ``namespace`` to the names bound afterwards and their types.
+    Syntax errors caught before dispatch set ``error_line`` and ``error_column``
+    (1-based) to where parsing failed.
+    """
+    output: str
+    error_type: str = None
+    error_message: str = None
+    traceback: str = None
+    metrics: dict = None
+    truncated_bytes: int = 0
+    full_output: str = None
+    namespace: dict = None
+    error_line: int = None
+    error_column: int = None
+
+    @property
+    def ok(self):
+        return self.error_type is None
+
+
+def failure_result(output, e):
+    """An ExecutionResult for a snippet that printed ``output`` and then raised ``e``"""
+    if isinstance(e, LimitExceeded):
+        # The stack only shows the limit machinery, so report just the limit
+        text = "".join(traceback.format_exception_only(type(e), e))
+    else:
+        text = traceback.format_exc()
+    return ExecutionResult(output, error_type=type(e).__name__, error_message=str(e), traceback=text)
+
+
+def syntax_error_result(e):
+    """An ExecutionResult for a snippet that failed to parse with ``e``, located by line and column"""
+    text = "".join(traceback.format_exception_only(type(e), e))
+    return ExecutionResult("", error_type=type(e).__name__, error_message=e.msg, traceback=text,
+                           error_line=e.lineno, error_column=e.offset)
+
+
+def _max_rss_bytes():
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _reset_rss_peak():
+    """Restart the kernel's RSS high-water mark (VmHWM); False where that is not possible"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def _rss_peak_bytes():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+@contextmanager
+def measure_peak_rss(metrics):
+    """Record the highest RSS the process reaches inside the block as ``peak_rss_bytes``
+
+    On Linux the high-water mark is reset on entry. Elsewhere only a block that
+    raises the process's lifetime peak (``ru_maxrss``) gets the metric.
+    """
+    reset = _reset_rss_peak()
+    before = None if reset else _max_rss_bytes()
+    try:
+        yield
+    finally:
+        if reset:
+            metrics["peak_rss_bytes"] = _rss_peak_bytes()
+        elif _max_rss_bytes() > before:
+            metrics["peak_rss_bytes"] = _max_rss_bytes()
+
+
+def _imported(value):
+    # Modules, and classes and functions defined outside the snippet, outlive it by design
+    if isinstance(value, types.ModuleType):
+        return True
+    if isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return getattr(value, "__module__", None) != "__main__"
+    return False
+
+
+def _teardown(namespace):
+    """Clear a run's namespace and return the types of the objects it created that survived"""
+    refs = []
+    for value in namespace.values():
+        if _imported(value):
+            continue
+        try:
+            refs.append(weakref.ref(value))
+        except TypeError:
+            pass  # ints, strings, lists...: not trackable, and never the interesting leaks
+    value = None
+    namespace.clear()
+    collected = gc.collect() if GC_AFTER_RUN else 0
+    return collected, sorted(type(ref()).__name__ for ref in refs if ref() is not None)
+
+
+@contextmanager
+def _stopwatch(metrics, name):
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        metrics[f"{name}_seconds"] = time.perf_counter() - wall
+        metrics[f"{name}_cpu_seconds"] = time.process_time() - cpu
+
+
+def run_snippet(source, limits=None, seed=None, globals_=None, locals_=None):
+    """Execute ``source`` with its stdout captured and return an ExecutionResult
+
+    With a ``seed`` the run sees seeded random generators and a frozen clock
+    (see runner.determinism), so its output is reproducible.
+
+    The result's metrics record when the run started (``started_at``, epoch
+    seconds, comparable across processes), wall and CPU seconds spent compiling
+    and executing, the captured ``output_bytes`` and the highest RSS the process
+    reached during the run (``peak_rss_bytes``; see measure_peak_rss, and only
+    meaningful when the run has the process to itself). Runs in their own namespace
+    also record the objects freed by the garbage collection after the run
+    (``gc_collected``) and the number and types of bound objects that are still
+    alive (``leaked_objects``, ``leaked_types``).
+    """
+    owned = globals_ is None
+    if owned:
+        globals_ = {"__name__": "__main__", "__builtins__": builtins}
+    if seed is not None:
+        globals_["__builtins__"] = seeded_builtins(seed)
+    metrics = {"started_at": time.time()}
+    output = BoundedCapture(max_bytes=limits.output_bytes if limits else None)
+    code = None
+    with measure_peak_rss(metrics):
+        try:
+            with _stopwatch(metrics, "compile"):
+                code = compile_snippet(source)
+            with _stopwatch(metrics, "exec"), capture(output):
+                if limits is None:
+                    exec(code, globals_, locals_)
+                else:
+                    with enforce(limits):
+                        exec(code, globals_, locals_)
+            result = ExecutionResult(output.getvalue())
+        except (Exception, LimitExceeded, SystemExit) as e:
+            # SystemExit too: sys.exit() in a snippet must not stop the worker or kernel running it
+            if code is None and isinstance(e, SyntaxError):
+                result = syntax_error_result(e)
+            else:
+                result = failure_result(output.getvalue(), e)
+        finally:
+            output.close()
+    metrics["output_bytes"] = output.written
+    if owned:
+        metrics["gc_collected"], leaked = _teardown(globals_)
+        metrics["leaked_objects"] = len(leaked)
+        if leaked:
+            metrics["leaked_types"] = leaked
+    result.metrics = metrics
+    result.truncated_bytes = output.dropped
+    result.full_output = output.spill_path
+    return result
@@ -0,0 +1,50 @@
+"""Page setup and snippet execution shared by the app pages
+
+Both pages run in one Streamlit server when started through ``app.py``, so they
+share the runner's backend, result cache, warm workers and telemetry. Each page
+also still runs on its own (``streamlit run basicc.py``).
+"""
+import uuid
+
+import streamlit as st
+
+import runner
+
+# Set by app.py, which configures the page itself before running one of the pages
+MULTIPAGE = False
+
+
+def setup_page(**page_config):
+    """Configure the page, start the runner and initialise this session's state"""
+    if not MULTIPAGE:
+        st.set_page_config(**page_config)
+    runner.load_snapshot()
+    runner.warm_up()
+    # Identifies this browser session in the execution telemetry
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    # Latest result of each example this session ran, kept across reruns and pages
+    if "outputs" not in st.session_state:
+        st.session_state.outputs = {}
+
+
+def session_controls():
+    """Sidebar switch for the opt-in session kernel; returns whether it is on"""
+    kernel_mode = st.sidebar.checkbox("Keep variables between runs", key="kernel_mode")
+    if kernel_mode and st.sidebar.button("Reset session", key="kernel-reset"):
+        runner.KERNELS.reset(st.session_state.session_id)
+    return kernel_mode
+
+
+def run(key, code, **options):
+    """Execute ``code`` for this session and store the ExecutionResult under ``key``
+
+    ``options`` are passed to runner.execute: deterministic snippets are served
+    from the shared cache unless ``cache=False``, a ``seed`` makes random numbers
+    and the clock reproducible, ``kernel`` runs in the session's namespace and
+    ``incremental`` re-executes only what an edit affected. Very long output is
+    shortened to its head and tail; ``full_output`` then names a file holding all of it.
+    """
+    result = runner.execute(code, session_id=st.session_state.session_id, **options)
+    st.session_state.outputs[key] = result
+    return result
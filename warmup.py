@@ -0,0 +1,64 @@
+"""Precompute every example's output so the apps serve the first click from cache
+
+Run once per deploy, before starting Streamlit:
+
+    python warmup.py [--app APP] [--output PATH] [--dataset ROWS]
+
+``--dataset`` also writes the generated employees table of that size to the
+dataset cache, so the first run at that size does not pay for generating it.
+Exits with status 1 when an example raised although it is not an
+``error_demo``, or an ``error_demo`` example ran without raising.
+"""
+import argparse
+import ast
+import sys
+
+import examples
+from examples import datasets
+from runner.cache import snippet_key
+from runner.snapshot import SNAPSHOT_PATH, build_snapshot, save_snapshot
+
+
+def dataset_options(example):
+    """Keyword arguments of the employees() call an example's ``dataset`` makes"""
+    call = ast.parse(example.dataset.format(rows=0), mode="eval").body
+    return tuple((keyword.arg, ast.literal_eval(keyword.value)) for keyword in call.keywords)
+
+
+def unexpected_outcomes(selected, snapshot):
+    """Examples whose snapshot result raised or not contrary to their ``error_demo`` flag"""
+    unexpected = []
+    for example in selected:
+        result = snapshot["results"].get(snippet_key(example.source, example.seed))
+        if result is not None and (result["error_type"] is not None) != example.error_demo:
+            unexpected.append((example, result))
+    return unexpected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute example outputs for the apps")
+    parser.add_argument("--app", choices=sorted(examples.APPS), action="append",
+                        help="only precompute this app's examples (repeatable)")
+    parser.add_argument("--output", default=str(SNAPSHOT_PATH), help="snapshot file to write")
+    parser.add_argument("--dataset", type=int, action="append", default=[], metavar="ROWS",
+                        help="pre-generate the employees table with ROWS rows (repeatable; needs pyarrow)")
+    args = parser.parse_args(argv)
+    for rows in args.dataset:
+        for options in sorted({dataset_options(e) for e in examples.EXAMPLES.values() if e.dataset}):
+            print(f"wrote {datasets.ensure_file(rows, **dict(options))}")
+    apps = args.app or list(examples.APPS)
+    selected = [example for app in apps for example in examples.APPS[app].EXAMPLES]
+    snapshot = build_snapshot(selected)
+    save_snapshot(snapshot, args.output)
+    print(f"wrote {len(snapshot['results'])} results to {args.output}")
+    unexpected = unexpected_outcomes(selected, snapshot)
+    for example, result in unexpected:
+        if example.error_demo:
+            print(f"UNEXPECTED {example.id}: error_demo example ran without raising")
+        else:
+            print(f"UNEXPECTED {example.id}: {result['error_type']}: {result['error_message']}")
+    return 1 if unexpected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())